@@ -1,11 +1,13 @@
 # src/color_sentence/__init__.py
 from __future__ import annotations
-from .core.engine import compute_color, prepare_engine
+from .core.engine import clear_compute_cache, compute_color, compute_colors, prepare_engine
 from .config.config import ComputeConfig
 from .config.types import ComputeMode, Denominator, ComputeResult, RGB
 
 __all__ = [
     "compute_color",
+    "compute_colors",
+    "clear_compute_cache",
     "prepare_engine",
     "ComputeConfig",
     "ComputeMode",
@@ -13,4 +13,7 @@ WINDOWS_POWERSHELL_CANDIDATES: Final[tuple[str, ...]] = ("powershell", "powershe
 
 WAV_CODEC: Final[str] = "pcm_s16le"
 WAV_CHANNELS: Final[str] = "1"
-WAV_RATE_HZ: Final[str] = "22050"
\ No newline at end of file
+WAV_RATE_HZ: Final[str] = "22050"
+
+# Decoded WAVs are kept next to their MP3s; beyond this total size the least recently played are deleted.
+WAV_CACHE_MAX_BYTES: Final[int] = 64 * 1024 * 1024
\ No newline at end of file
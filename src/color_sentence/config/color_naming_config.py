@@ -3,6 +3,7 @@ from __future__ import annotations
 HSV thresholds and hue bands used for coarse color naming.
 """
 
+from itertools import pairwise
 from typing import Final, NamedTuple, Sequence
 
 
@@ -33,3 +34,17 @@ HUE_BANDS: Final[Sequence[HueBand]] = (
 )
 
 DEFAULT_HUE_NAME: Final[str] = "pinkish"
+
+
+def _band_edges(bands: Sequence[HueBand]) -> tuple[float, ...]:
+    """Return band starts plus the end of the last band; bands must be sorted and contiguous."""
+    for previous, current in pairwise(bands):
+        if previous.end_exclusive != current.start_inclusive:
+            raise ValueError(f"Hue bands must be contiguous: {previous!r} is followed by {current!r}")
+    return tuple(band.start_inclusive for band in bands) + (bands[-1].end_exclusive,)
+
+
+# Parallel arrays for bisect lookup: hue in [BAND_STARTS[i], BAND_STARTS[i + 1]) → BAND_NAMES[i].
+# The trailing sentinel maps hues at or beyond the last band end to DEFAULT_HUE_NAME.
+BAND_STARTS: Final[tuple[float, ...]] = _band_edges(HUE_BANDS)
+BAND_NAMES: Final[tuple[str, ...]] = tuple(band.name for band in HUE_BANDS) + (DEFAULT_HUE_NAME,)
@@ -14,7 +14,7 @@ from typing import Final, Tuple
 from .types import Denominator, ComputeMode, ITTS, ITTSRunner
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LengthFloorConfig:
     """Brightness targets depending on visible text length (short = brighter)."""
     short_visible_max: int = 6
@@ -24,7 +24,7 @@ class LengthFloorConfig:
     linear_step: int = 5
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PunctuationConfig:
     """Weights translating punctuation into brightness/saturation multipliers."""
     weight_exclamation: int = 2
@@ -36,7 +36,7 @@ class PunctuationConfig:
     sat_per_score: float = 0.10
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnchorConfig:
     """Alphabet anchor indices for R/G/B on a circular a–z (0..25) scale."""
     index_r: int = 17  # 'r'
@@ -65,7 +65,7 @@ class GttsPlaybackConfig:
     wav_rate_hz: str = "22050"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ComputeConfig:
     """
     Configuration controlling color computation and optional TTS behavior.
@@ -104,3 +104,13 @@ class ColorNameConfig:
 
 
 COLOR_NAME: Final[ColorNameConfig] = ColorNameConfig()
+
+
+@dataclass(frozen=True, slots=True)
+class CacheConfig:
+    """Maximum entry counts of the in-process memoization caches."""
+    compute_results: int = 1024
+    display_names: int = 4096
+
+
+CACHE: Final[CacheConfig] = CacheConfig()
@@ -19,5 +19,11 @@ BUTTON_SIZE_PX: Final[int] = 80
 COLOR_BOX_MIN_W: Final[int] = 200
 COLOR_BOX_MIN_H: Final[int] = 100
 
-# If computed luminance (0–255 scale) exceeds this value, use dark text on the color box.
-LUMINANCE_DARK_TEXT_THRESHOLD: Final[float] = 160.0
\ No newline at end of file
+# Integer luminance: Rec.709 weights (0.2126, 0.7152, 0.0722) scaled by 2**LUMA_SHIFT (sum = 256).
+LUMA_SHIFT: Final[int] = 8
+LUMA_WEIGHT_R: Final[int] = 54
+LUMA_WEIGHT_G: Final[int] = 183
+LUMA_WEIGHT_B: Final[int] = 19
+
+# If luminance (0–255 scale) exceeds this value, use dark text on the color box.
+LUMINANCE_DARK_TEXT_THRESHOLD_INT: Final[int] = 160
\ No newline at end of file
@@ -2,7 +2,8 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum
-from typing import Protocol, TypeAlias
+from pathlib import Path
+from typing import Protocol, TypeAlias, runtime_checkable
 
 RGB: TypeAlias = tuple[int, int, int]
 """RGB tuple with 8-bit channels (red, green, blue)."""
@@ -18,6 +19,17 @@ class ITTS(Protocol):
         ...
 
 
+@runtime_checkable
+class IPrefetchTTS(ITTS, Protocol):
+    """TTS backend with separate synthesis and playback, so a runner can synthesize ahead of playback."""
+    def synthesize(self, text: str) -> Path:
+        """Produce (or reuse) the audio file for the text without playing it."""
+        ...
+    def play(self, audio_path: Path) -> None:
+        """Play an audio file produced by synthesize (blocks until done)."""
+        ...
+
+
 class ITTSRunner(Protocol):
     """Interface for a non-blocking TTS runner that executes TTS in the background."""
     def ensure_started(self) -> None:
@@ -44,7 +56,7 @@ class ComputeMode(Enum):
     ANCHOR = "anchor"       # nearest-letter anchor mapping on a mod-26 circle
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ComputeResult:
     """Final color result for a given input text."""
     rgb: RGB
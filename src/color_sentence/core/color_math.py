@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 from color_sentence.config.color_naming_config import DEGREES_FULL_CIRCLE, HSV_BLACK_VALUE_MAX, HSV_WHITE_VALUE_MIN, \
-    HSV_WHITE_SAT_MAX, HSV_GRAY_SAT_MAX, HUE_BANDS, DEFAULT_HUE_NAME
+    HSV_WHITE_SAT_MAX, HSV_GRAY_SAT_MAX, DEFAULT_HUE_NAME, BAND_STARTS, BAND_NAMES
 
 """
 Utility functions for RGB channel clamping, hex conversion, coarse color naming, and
 simple saturation/brightness adjustments.
 """
 
-import colorsys
+import sys
+from bisect import bisect_right
 from typing import Final
 
 from color_sentence.config.types import RGB
@@ -24,90 +25,85 @@ __all__ = [
 MIN_BYTE: Final[int] = 0
 MAX_BYTE: Final[int] = 255
 
+# Two-digit uppercase hex for every channel value, formatted once.
+_HEX_BYTES: Final[tuple[str, ...]] = tuple(f"{value:02X}" for value in range(MAX_BYTE + 1))
+
+# Shared (interned) name objects, so every result carrying the same name points to one str.
+_NAME_BLACK: Final[str] = sys.intern("black")
+_NAME_WHITE: Final[str] = sys.intern("white")
+_NAME_GRAY: Final[str] = sys.intern("gray")
+_NAME_DEFAULT: Final[str] = sys.intern(DEFAULT_HUE_NAME)
+_BAND_NAMES: Final[tuple[str, ...]] = tuple(sys.intern(name) for name in BAND_NAMES)
+
+# Hue is measured in six 60° sectors; green-max starts at sector 2, blue-max at sector 4.
+DEGREES_PER_HUE_SECTOR: Final[float] = 60.0
+HUE_SECTOR_OFFSET_GREEN: Final[float] = 2.0
+HUE_SECTOR_OFFSET_BLUE: Final[float] = 4.0
+
 
 def clamp_byte(value: int) -> int:
     """
     Clamp an integer to the valid 8-bit color channel range [0, 255].
     """
-    clamped: int = value
-    if clamped < MIN_BYTE:
-        clamped = MIN_BYTE
-    elif clamped > MAX_BYTE:
-        clamped = MAX_BYTE
-    return clamped
+    return MIN_BYTE if value < MIN_BYTE else MAX_BYTE if value > MAX_BYTE else value
 
 
 def rgb_to_hex(red: int, green: int, blue: int) -> str:
     """
     Convert three 8-bit channels into a #RRGGBB hex string.
     """
-    hex_string: str = f"#{red:02X}{green:02X}{blue:02X}"
+    hex_string: str = "#" + _HEX_BYTES[red] + _HEX_BYTES[green] + _HEX_BYTES[blue]
     return hex_string
 
 
 def approx_color_name(red: int, green: int, blue: int) -> str:
     """
     Return a coarse color name derived from RGB via HSV thresholds.
-    """
-    red_norm: float = red / float(MAX_BYTE)
-    green_norm: float = green / float(MAX_BYTE)
-    blue_norm: float = blue / float(MAX_BYTE)
-
-    hue_fraction: float
-    saturation: float
-    value: float
-    hue_fraction, saturation, value = colorsys.rgb_to_hsv(red_norm, green_norm, blue_norm)
-    hue_degrees: float = hue_fraction * DEGREES_FULL_CIRCLE
-
-    if value < HSV_BLACK_VALUE_MAX:
-        return "black"
-    if value > HSV_WHITE_VALUE_MIN and saturation < HSV_WHITE_SAT_MAX:
-        return "white"
-    if saturation < HSV_GRAY_SAT_MAX:
-        return "gray"
 
-    for band in HUE_BANDS:
-        if band.start_inclusive <= hue_degrees < band.end_exclusive:
-            return band.name
-
-    return DEFAULT_HUE_NAME
-
-
-def apply_saturation(rgb: RGB, saturation_multiplier: float) -> RGB:
+    HSV is computed inline on the 8-bit channels (value = max, saturation = delta / max);
+    the thresholds are compared in the 0–255 domain to avoid per-channel normalization.
+    """
+    channel_max: int = max(red, green, blue)
+    channel_min: int = min(red, green, blue)
+    delta: int = channel_max - channel_min
+
+    if channel_max < HSV_BLACK_VALUE_MAX * MAX_BYTE:
+        return _NAME_BLACK
+    if channel_max > HSV_WHITE_VALUE_MIN * MAX_BYTE and delta < HSV_WHITE_SAT_MAX * channel_max:
+        return _NAME_WHITE
+    if delta < HSV_GRAY_SAT_MAX * channel_max:
+        return _NAME_GRAY
+
+    hue_sector: float
+    if channel_max == red:
+        hue_sector = (green - blue) / delta
+    elif channel_max == green:
+        hue_sector = HUE_SECTOR_OFFSET_GREEN + (blue - red) / delta
+    else:
+        hue_sector = HUE_SECTOR_OFFSET_BLUE + (red - green) / delta
+    hue_degrees: float = (hue_sector * DEGREES_PER_HUE_SECTOR) % DEGREES_FULL_CIRCLE
+
+    band_index: int = bisect_right(BAND_STARTS, hue_degrees) - 1
+    return _BAND_NAMES[band_index] if band_index >= 0 else _NAME_DEFAULT
+
+
+def apply_saturation(red_in: int, green_in: int, blue_in: int, saturation_multiplier: float) -> RGB:
     """
     Scale saturation by moving each channel away from or towards the mean.
     """
-    red_in: int = rgb[0]
-    green_in: int = rgb[1]
-    blue_in: int = rgb[2]
-
     mean_value: float = (red_in + green_in + blue_in) / 3.0
 
-    def adjust(channel: int) -> int:
-        adjusted_float: float = mean_value + (channel - mean_value) * saturation_multiplier
-        adjusted_int: int = int(round(adjusted_float))
-        return clamp_byte(adjusted_int)
-
-    red_out: int = adjust(red_in)
-    green_out: int = adjust(green_in)
-    blue_out: int = adjust(blue_in)
+    red_out: int = clamp_byte(int(round(mean_value + (red_in - mean_value) * saturation_multiplier)))
+    green_out: int = clamp_byte(int(round(mean_value + (green_in - mean_value) * saturation_multiplier)))
+    blue_out: int = clamp_byte(int(round(mean_value + (blue_in - mean_value) * saturation_multiplier)))
     return red_out, green_out, blue_out
 
 
-def apply_brightness(rgb: RGB, brightness_multiplier: float) -> RGB:
+def apply_brightness(red_in: int, green_in: int, blue_in: int, brightness_multiplier: float) -> RGB:
     """
     Scale brightness by multiplying each channel with a common factor.
     """
-    red_in: int = rgb[0]
-    green_in: int = rgb[1]
-    blue_in: int = rgb[2]
-
-    def adjust(channel: int) -> int:
-        adjusted_float: float = channel * brightness_multiplier
-        adjusted_int: int = int(round(adjusted_float))
-        return clamp_byte(adjusted_int)
-
-    red_out: int = adjust(red_in)
-    green_out: int = adjust(green_in)
-    blue_out: int = adjust(blue_in)
+    red_out: int = clamp_byte(int(round(red_in * brightness_multiplier)))
+    green_out: int = clamp_byte(int(round(green_in * brightness_multiplier)))
+    blue_out: int = clamp_byte(int(round(blue_in * brightness_multiplier)))
     return red_out, green_out, blue_out
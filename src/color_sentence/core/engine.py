@@ -1,14 +1,19 @@
 # src/color_sentence/core/engine.py
 from __future__ import annotations
 
-from typing import List, Tuple, Type
+import string
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Final, NamedTuple, Sequence, Tuple, Type, TypeAlias
 
 from color_sentence.config.config import (
     ANCHOR,
+    CACHE,
     COLOR_NAME,
     LENGTH_FLOOR,
     PUNCT,
     ComputeConfig,
+    LengthFloorConfig,
+    PunctuationConfig,
 )
 from color_sentence.config.types import ComputeMode, Denominator, RGB, ComputeResult
 from color_sentence.core.color_math import (
@@ -17,97 +22,131 @@ from color_sentence.core.color_math import (
     apply_saturation,
     rgb_to_hex,
 )
-from color_sentence.core.normalization import letters_only, transliterate_de, visible_len
+from color_sentence.core.normalization import folded_letter_bytes, transliterate_de, visible_len
 from color_sentence.core.overrides import find_override_and_weight
 from color_sentence.tts.utterances import make_tts_sentence
 
+if TYPE_CHECKING:
+    from color_sentence.net.color_api import ColorNameInfo
+
+_PizzaLookup: TypeAlias = Callable[[str], "ColorNameInfo"]
+_PizzaBatchLookup: TypeAlias = Callable[[Sequence[str]], "list[ColorNameInfo]"]
+
+# Score adjustment for the last visible character of the text.
+_END_SCORES: Final[dict[str, int]] = {"!": PUNCT.end_bonus, "?": -PUNCT.end_bonus}
+
+# Override blending in Q0.8 fixed point: weights are scaled to 0..256, results rounded half up.
+_BLEND_SHIFT: Final[int] = 8
+_BLEND_ONE: Final[int] = 1 << _BLEND_SHIFT
+_BLEND_HALF: Final[int] = _BLEND_ONE >> 1
+
+# Result of text without visible characters: constant, named locally (no Color.Pizza lookup).
+_BLACK_RGB: Final[RGB] = (0, 0, 0)
+_BLACK_HEX: Final[str] = "#000000"
+_BLANK_RESULT: Final[ComputeResult] = ComputeResult(
+    rgb=_BLACK_RGB, hex=_BLACK_HEX, name=approx_color_name(_BLACK_RGB[0], _BLACK_RGB[1], _BLACK_RGB[2])
+)
+
+# Shared default for the public entry points (one frozen instance instead of a call in the signature).
+_DEFAULT_CONFIG: Final[ComputeConfig] = ComputeConfig()
+
+_ALPHABET_SIZE: Final[int] = 26
+_ANCHOR_BIT_R: Final[int] = 1
+_ANCHOR_BIT_G: Final[int] = 2
+_ANCHOR_BIT_B: Final[int] = 4
+
+
+class _TextScan(NamedTuple):
+    """Everything the color pipeline reads from the text, gathered once per computation."""
+    letters: bytes  # ASCII letters folded to lowercase, in input order
+    visible_count: int
+    exclamation_count: int
+    question_count: int
+    last_visible: str  # last non-whitespace character, or "" for blank text
+
+
+def _scan_text(text_trans: str) -> _TextScan:
+    """
+    Collect letter, visible and punctuation counts of the transliterated text.
+
+    Every field is produced by a C-level primitive (bytes/str translate and count), which
+    is faster in CPython than one Python-level or Counter-based pass over the characters.
+    """
+    return _TextScan(
+        letters=folded_letter_bytes(text_trans),
+        visible_count=visible_len(text_trans),
+        exclamation_count=text_trans.count("!"),
+        question_count=text_trans.count("?"),
+        last_visible=text_trans.rstrip()[-1:],
+    )
+
 
 def _to_byte_0_1(value: float) -> int:
     """Convert a clamped proportion in [0.0, 1.0] to an 8-bit channel [0, 255]."""
-    clamped: float = 0.0 if value < 0.0 else (1.0 if value > 1.0 else value)
-    scaled: float = clamped * 255.0
-    channel: int = int(round(scaled))
-    return channel
+    return int(round(value * 255.0)) if 0.0 <= value <= 1.0 else (0 if value < 0.0 else 255)
 
 
 def _length_floor_target(visible_count: int) -> int:
     """Return the target max channel for brightness based on visible text length."""
-    if visible_count <= LENGTH_FLOOR.short_visible_max:
-        return LENGTH_FLOOR.bright_at_short
-    if visible_count >= LENGTH_FLOOR.long_visible_min:
-        return LENGTH_FLOOR.bright_at_long
-    delta: int = visible_count - LENGTH_FLOOR.short_visible_max
-    target: int = int(round(LENGTH_FLOOR.bright_at_short - LENGTH_FLOOR.linear_step * delta))
+    floor: LengthFloorConfig = LENGTH_FLOOR  # local binding: one global lookup per call
+    if visible_count <= floor.short_visible_max:
+        return floor.bright_at_short
+    if visible_count >= floor.long_visible_min:
+        return floor.bright_at_long
+    delta: int = visible_count - floor.short_visible_max
+    target: int = int(round(floor.bright_at_short - floor.linear_step * delta))
     return target
 
 
-def _apply_length_floor(rgb: RGB, base_count: int, cfg: ComputeConfig) -> RGB:
+def _apply_length_floor(red: int, green: int, blue: int, base_count: int, cfg: ComputeConfig) -> RGB:
     """Raise brightness for short inputs and cap very dark results (frequency mode)."""
     if not cfg.apply_length_floor or base_count <= 0:
-        return rgb
-    red: int = rgb[0]
-    green: int = rgb[1]
-    blue: int = rgb[2]
+        return red, green, blue
     current_max: int = max(red, green, blue)
     target_max: int = _length_floor_target(base_count)
     if current_max <= 0 or current_max >= target_max:
-        return rgb
-    factor: float = target_max / float(current_max)
-    red_out: int = min(255, int(round(float(red) * factor)))
-    green_out: int = min(255, int(round(float(green) * factor)))
-    blue_out: int = min(255, int(round(float(blue) * factor)))
+        return red, green, blue
+    # Scale by target_max / current_max with integer round-half-up division.
+    half_max: int = current_max // 2
+    red_out: int = min(255, (red * target_max + half_max) // current_max)
+    green_out: int = min(255, (green * target_max + half_max) // current_max)
+    blue_out: int = min(255, (blue * target_max + half_max) // current_max)
     return red_out, green_out, blue_out
 
 
-def _luminance_255(rgb: RGB) -> float:
+def _luminance_255(red: int, green: int, blue: int) -> float:
     """Return perceived luminance on a 0..255 scale (sRGB weights)."""
-    red: float = float(rgb[0])
-    green: float = float(rgb[1])
-    blue: float = float(rgb[2])
     return 0.2126 * red + 0.7152 * green + 0.0722 * blue
 
 
-def _punctuation_multipliers(original_text: str) -> Tuple[float, float]:
+def _punctuation_multipliers(scan: _TextScan) -> Tuple[float, float]:
     """Compute brightness and saturation multipliers from punctuation counts."""
-    count_excl: int = original_text.count("!")
-    count_quest: int = original_text.count("?")
-    score: int = PUNCT.weight_exclamation * count_excl + PUNCT.weight_question * count_quest
-
-    tail: str = original_text.rstrip()
-    if tail.endswith("!"):
-        score += PUNCT.end_bonus
-    elif tail.endswith("?"):
-        score -= PUNCT.end_bonus
-
-    if score < PUNCT.score_min:
-        score = PUNCT.score_min
-    elif score > PUNCT.score_max:
-        score = PUNCT.score_max
-
-    brightness_multiplier: float = 1.0 + PUNCT.bright_per_score * float(score)
-    saturation_multiplier: float = 1.0 + PUNCT.sat_per_score * float(score)
+    punct: PunctuationConfig = PUNCT  # local binding: one global lookup per call
+    raw_score: int = (
+        punct.weight_exclamation * scan.exclamation_count
+        + punct.weight_question * scan.question_count
+        + _END_SCORES.get(scan.last_visible, 0)
+    )
+    score: int = min(punct.score_max, max(punct.score_min, raw_score))
+
+    brightness_multiplier: float = 1.0 + punct.bright_per_score * float(score)
+    saturation_multiplier: float = 1.0 + punct.sat_per_score * float(score)
     return brightness_multiplier, saturation_multiplier
 
 
-def _compute_rgb_freq(text_trans: str, denominator: Denominator) -> Tuple[RGB, int]:
+def _compute_rgb_freq(scan: _TextScan, denominator: Denominator) -> Tuple[RGB, int]:
     """Compute base RGB via r/g/b letter frequencies. Returns (rgb, base_count)."""
-    letters: List[str]
-    base_count: int
+    red_count: int = scan.letters.count(b"r")
+    green_count: int = scan.letters.count(b"g")
+    blue_count: int = scan.letters.count(b"b")
 
+    base_count: int
     if denominator is Denominator.VISIBLE:
-        base_count = visible_len(text_trans)
-        letters = letters_only(text_trans)
+        base_count = scan.visible_count
     elif denominator is Denominator.LETTERS:
-        letters = letters_only(text_trans)
-        base_count = len(letters)
+        base_count = len(scan.letters)
     else:
-        letters = letters_only(text_trans)
-        hits: int = sum(1 for ch in letters if ch in "rRgGbB")
-        base_count = max(1, hits)
-
-    red_count: int = sum(1 for ch in letters if ch in "rR")
-    green_count: int = sum(1 for ch in letters if ch in "gG")
-    blue_count: int = sum(1 for ch in letters if ch in "bB")
+        base_count = max(1, red_count + green_count + blue_count)
 
     red: int = _to_byte_0_1((red_count / base_count) if base_count > 0 else 0.0)
     green: int = _to_byte_0_1((green_count / base_count) if base_count > 0 else 0.0)
@@ -115,43 +154,59 @@ def _compute_rgb_freq(text_trans: str, denominator: Denominator) -> Tuple[RGB, i
     return (red, green, blue), base_count
 
 
-def _letter_index(letter: str) -> int | None:
-    """Map 'a'..'z' (case-insensitive) to 0..25; return None for non-letters."""
-    lower: str = letter.lower()
-    if "a" <= lower <= "z":
-        return ord(lower) - ord("a")
-    return None
-
-
-def _nearest_anchor_keys(alpha_index: int) -> list[str]:
-    """Return anchor key(s) among {'R','G','B'} with minimal circular distance."""
-    distances: dict[str, int] = {}
-    for key, idx in (("R", ANCHOR.index_r), ("G", ANCHOR.index_g), ("B", ANCHOR.index_b)):
-        forward: int = (alpha_index - idx) % 26
-        backward: int = (idx - alpha_index) % 26
-        distance: int = forward if forward < backward else backward
-        distances[key] = distance
-
-    best_distance: int = min(distances.values())
-    winners: list[str] = [k for k, d in distances.items() if d == best_distance]
-    return winners
+def _circular_distance(alpha_index: int, anchor_index: int) -> int:
+    """Return the distance between two letter indices on the mod-26 circle."""
+    forward: int = (alpha_index - anchor_index) % _ALPHABET_SIZE
+    backward: int = (anchor_index - alpha_index) % _ALPHABET_SIZE
+    return forward if forward < backward else backward
+
+
+def _nearest_anchor_mask(alpha_index: int) -> int:
+    """Return the anchor(s) with minimal circular distance as a bitmask (R=1, G=2, B=4; ties set several bits)."""
+    distance_r: int = _circular_distance(alpha_index, ANCHOR.index_r)
+    distance_g: int = _circular_distance(alpha_index, ANCHOR.index_g)
+    distance_b: int = _circular_distance(alpha_index, ANCHOR.index_b)
+    best_distance: int = min(distance_r, distance_g, distance_b)
+    mask: int = 0
+    if distance_r == best_distance:
+        mask |= _ANCHOR_BIT_R
+    if distance_g == best_distance:
+        mask |= _ANCHOR_BIT_G
+    if distance_b == best_distance:
+        mask |= _ANCHOR_BIT_B
+    return mask
+
+
+def _mask_shares(mask: int) -> Tuple[float, float, float]:
+    """Return the (R, G, B) share of one letter with the given anchor mask; ties split evenly."""
+    share: float = 1.0 / float(mask.bit_count())
+    red_share: float = share if mask & _ANCHOR_BIT_R else 0.0
+    green_share: float = share if mask & _ANCHOR_BIT_G else 0.0
+    blue_share: float = share if mask & _ANCHOR_BIT_B else 0.0
+    return red_share, green_share, blue_share
+
+
+# The anchor mask depends only on the letter: evaluate it once for a..z and keep it as a
+# translate table, so a text's letters map to mask bytes in one C-level pass.
+_LETTER_ANCHOR_MASKS: Final[bytes] = bytes(_nearest_anchor_mask(alpha_index) for alpha_index in range(_ALPHABET_SIZE))
+_ANCHOR_MASK_TABLE: Final[bytes] = bytes.maketrans(string.ascii_lowercase.encode("ascii"), _LETTER_ANCHOR_MASKS)
+_ANCHOR_MASK_SHARES: Final[Tuple[Tuple[bytes, Tuple[float, float, float]], ...]] = tuple(
+    (bytes((mask,)), _mask_shares(mask)) for mask in sorted(set(_LETTER_ANCHOR_MASKS))
+)
 
 
-def _compute_rgb_anchor(text_trans: str) -> RGB:
+def _compute_rgb_anchor(scan: _TextScan) -> RGB:
     """Compute base RGB via nearest R/G/B anchors on a mod-26 circle, scaled to max 255."""
-    counts: dict[str, float] = {"R": 0.0, "G": 0.0, "B": 0.0}
-    for ch in text_trans:
-        idx_opt: int | None = _letter_index(ch)
-        if idx_opt is None:
-            continue
-        winners: list[str] = _nearest_anchor_keys(idx_opt)
-        share: float = 1.0 / float(len(winners))
-        for key in winners:
-            counts[key] += share
-
-    red_sum: float = counts["R"]
-    green_sum: float = counts["G"]
-    blue_sum: float = counts["B"]
+    masks: bytes = scan.letters.translate(_ANCHOR_MASK_TABLE)
+    red_sum: float = 0.0
+    green_sum: float = 0.0
+    blue_sum: float = 0.0
+    for mask_byte, shares in _ANCHOR_MASK_SHARES:
+        count: int = masks.count(mask_byte)
+        red_sum += count * shares[0]
+        green_sum += count * shares[1]
+        blue_sum += count * shares[2]
+
     maximum: float = max(red_sum, green_sum, blue_sum)
     if maximum == 0.0:
         return 0, 0, 0
@@ -163,78 +218,142 @@ def _compute_rgb_anchor(text_trans: str) -> RGB:
     return red, green, blue
 
 
-def _blend_override(rgb: RGB, text_trans: str) -> RGB:
+def _blend_override(red: int, green: int, blue: int, text_trans: str) -> RGB:
     """Blend semantic override color into the base RGB if present."""
     found = find_override_and_weight(text_trans)
     if found is None:
-        return rgb
+        return red, green, blue
     override_rgb: RGB = found[0]
-    weight: float = found[1]
-    red: int = int(round((1.0 - weight) * float(rgb[0]) + weight * float(override_rgb[0])))
-    green: int = int(round((1.0 - weight) * float(rgb[1]) + weight * float(override_rgb[1])))
-    blue: int = int(round((1.0 - weight) * float(rgb[2]) + weight * float(override_rgb[2])))
-    return red, green, blue
+    weight_fixed: int = int(found[1] * _BLEND_ONE + 0.5)
+    base_weight_fixed: int = _BLEND_ONE - weight_fixed
+    red_out: int = (red * base_weight_fixed + override_rgb[0] * weight_fixed + _BLEND_HALF) >> _BLEND_SHIFT
+    green_out: int = (green * base_weight_fixed + override_rgb[1] * weight_fixed + _BLEND_HALF) >> _BLEND_SHIFT
+    blue_out: int = (blue * base_weight_fixed + override_rgb[2] * weight_fixed + _BLEND_HALF) >> _BLEND_SHIFT
+    return red_out, green_out, blue_out
 
 
-def _apply_punctuation(rgb: RGB, original_text: str, cfg: ComputeConfig) -> RGB:
+def _apply_punctuation(red: int, green: int, blue: int, scan: _TextScan, cfg: ComputeConfig) -> RGB:
     """Apply punctuation-based brightness/saturation; enforce monotone luminance."""
     if not cfg.punctuation_mods:
-        return rgb
+        return red, green, blue
 
-    base_luminance: float = _luminance_255(rgb)
+    base_luminance: float = _luminance_255(red, green, blue)
 
-    multipliers: Tuple[float, float] = _punctuation_multipliers(original_text)
+    multipliers: Tuple[float, float] = _punctuation_multipliers(scan)
     brightness_multiplier: float = multipliers[0]
     saturation_multiplier: float = multipliers[1]
 
-    after_sat: RGB = apply_saturation(rgb, saturation_multiplier)
-    after_bright: RGB = apply_brightness(after_sat, brightness_multiplier)
+    sat_red: int
+    sat_green: int
+    sat_blue: int
+    sat_red, sat_green, sat_blue = apply_saturation(red, green, blue, saturation_multiplier)
+    bright_red: int
+    bright_green: int
+    bright_blue: int
+    bright_red, bright_green, bright_blue = apply_brightness(sat_red, sat_green, sat_blue, brightness_multiplier)
 
-    new_luminance: float = _luminance_255(after_bright)
+    new_luminance: float = _luminance_255(bright_red, bright_green, bright_blue)
 
     # If we intended to darken but luminance increased, scale back to baseline.
     if brightness_multiplier < 1.0 and new_luminance > base_luminance and new_luminance > 0.0:
         scale_down: float = base_luminance / new_luminance
-        return apply_brightness(after_bright, scale_down)
+        return apply_brightness(bright_red, bright_green, bright_blue, scale_down)
 
     # If we intended to brighten but luminance decreased, scale up to baseline.
     if brightness_multiplier > 1.0 and base_luminance > new_luminance > 0.0:
         scale_up: float = base_luminance / new_luminance
-        return apply_brightness(after_bright, scale_up)
+        return apply_brightness(bright_red, bright_green, bright_blue, scale_up)
 
-    return after_bright
+    return bright_red, bright_green, bright_blue
 
 
-def _resolve_display_name(hex_code: str, rgb: RGB) -> str:
-    """Resolve a human-readable name using Color.Pizza with a distance cap; fall back to HSV heuristic."""
-    try:
-        from color_sentence.net.color_api import (  # type: ignore[reportGeneralTypeIssues]
-            ColorNameInfo,
-            get_color_name_from_hex as pizza_lookup,
-        )
-    except ImportError:
-        pizza_lookup = None  # type: ignore[assignment]
-        ColorNameInfo = None
+class _DepsBundle(NamedTuple):
+    """Optional dependencies of the name resolution, probed once per process."""
+    pizza_lookup: _PizzaLookup | None
+    pizza_batch_lookup: _PizzaBatchLookup | None
+    api_errors: Tuple[Type[BaseException], ...]
+
 
+def _probe_deps() -> _DepsBundle:
+    """Import the optional Color.Pizza client; collect the errors that count as API failure."""
     api_errors: Tuple[Type[BaseException], ...] = (ValueError, RuntimeError)
     try:
-        import httpx  # type: ignore[import-not-found]
-        api_errors = api_errors + (httpx.HTTPError,)  # type: ignore[attr-defined]
+        import httpx
+
+        from color_sentence.net.color_api import get_color_name_from_hex, get_color_names_from_hexes
     except ImportError:
-        pass
+        return _DepsBundle(pizza_lookup=None, pizza_batch_lookup=None, api_errors=api_errors)
+    return _DepsBundle(
+        pizza_lookup=get_color_name_from_hex,
+        pizza_batch_lookup=get_color_names_from_hexes,
+        api_errors=api_errors + (httpx.HTTPError,),
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_deps() -> _DepsBundle:
+    """Return the probed optional dependencies; the first caller (normally prepare_engine) initializes them."""
+    return _probe_deps()
+
+
+def _hex_to_rgb(hex_code: str) -> RGB:
+    """Parse a '#RRGGBB' string produced by rgb_to_hex back into channels."""
+    packed: int = int(hex_code[1:], 16)
+    return (packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF
+
+
+@lru_cache(maxsize=CACHE.display_names)
+def _lookup_display_name(hex_code: str) -> str:
+    """
+    Resolve a human-readable name using Color.Pizza with a distance cap; fall back to HSV heuristic.
+
+    Only definitive answers are memoized (API name, distance too large, no client installed);
+    API errors propagate, so a transient failure is retried on the next lookup.
+    """
+    pizza_lookup: _PizzaLookup | None = _get_deps().pizza_lookup
+    rgb: RGB = _hex_to_rgb(hex_code)
 
     if pizza_lookup is None:
         return approx_color_name(rgb[0], rgb[1], rgb[2])
 
+    info: ColorNameInfo = pizza_lookup(hex_code)
+    if info.distance <= COLOR_NAME.api_distance_max:
+        return info.display_name
+    return approx_color_name(rgb[0], rgb[1], rgb[2])
+
+
+def _resolve_display_name(hex_code: str) -> str:
+    """Like _lookup_display_name, but answer API errors with the (unmemoized) HSV heuristic."""
+    api_errors: Tuple[Type[BaseException], ...] = _get_deps().api_errors
     try:
-        info: ColorNameInfo = pizza_lookup(hex_code)  # type: ignore[operator]
-        if info.distance <= COLOR_NAME.api_distance_max:
-            return info.display_name
-        return approx_color_name(rgb[0], rgb[1], rgb[2])
-    except api_errors:  # type: ignore[misc]
+        return _lookup_display_name(hex_code)
+    except api_errors:
+        rgb: RGB = _hex_to_rgb(hex_code)
         return approx_color_name(rgb[0], rgb[1], rgb[2])
 
 
+def _prefetch_display_names(texts: Sequence[str], compute_key: ComputeConfig) -> None:
+    """
+    Resolve the names of all colors of a batch with one Color.Pizza request, memoizing them per hex.
+
+    The colors come from the memoized _compute_rgb_hex, which the per-text results reuse, and
+    the lookups that follow are answered from the client's cache. Errors are ignored here:
+    the per-text path retries and falls back to the HSV heuristic on its own.
+    """
+    deps: _DepsBundle = _get_deps()
+    if deps.pizza_batch_lookup is None:
+        return
+    hex_codes: list[str] = [
+        _compute_rgb_hex(text, compute_key)[1] for text in dict.fromkeys(texts) if text and not text.isspace()
+    ]
+    if not hex_codes:
+        return
+    try:
+        deps.pizza_batch_lookup(hex_codes)
+    except deps.api_errors:
+        return
+
+
 def _maybe_speak(original_text: str, result: ComputeResult, cfg: ComputeConfig) -> None:
     """Trigger TTS synchronously or via runner if enabled; ignore runtime TTS errors."""
     if not cfg.speak_enabled or cfg.tts_backend is None:
@@ -257,7 +376,69 @@ def _maybe_speak(original_text: str, result: ComputeResult, cfg: ComputeConfig)
         return
 
 
-def compute_color(text: str, cfg: ComputeConfig = ComputeConfig()) -> ComputeResult:
+def _compute_key(cfg: ComputeConfig) -> ComputeConfig:
+    """Reduce a config to the fields that influence the color, so it can key the result cache."""
+    return ComputeConfig(
+        denominator=cfg.denominator,
+        punctuation_mods=cfg.punctuation_mods,
+        apply_length_floor=cfg.apply_length_floor,
+        mode=cfg.mode,
+    )
+
+
+@lru_cache(maxsize=CACHE.compute_results)
+def _compute_rgb_hex(text: str, cfg: ComputeConfig) -> tuple[RGB, str]:
+    """
+    Steps 1–5 of compute_color: the color itself, without the display name.
+
+    Memoized separately from the full result, so compute_colors can learn the hex codes
+    of a batch (for its name request) without running the pipeline twice per text.
+    """
+    text_trans: str = transliterate_de(text)
+    scan: _TextScan = _scan_text(text_trans)
+
+    # Channels travel as three ints between the stages; RGB tuples are unpacked once per stage.
+    red: int
+    green: int
+    blue: int
+
+    if cfg.mode is ComputeMode.FREQ:
+        freq_rgb: RGB
+        base_count: int
+        freq_rgb, base_count = _compute_rgb_freq(scan, cfg.denominator)
+        red, green, blue = freq_rgb
+        red, green, blue = _apply_length_floor(red, green, blue, base_count, cfg)
+    else:
+        red, green, blue = _compute_rgb_anchor(scan)
+
+    red, green, blue = _blend_override(red, green, blue, text_trans)
+    with_punct: RGB = _apply_punctuation(red, green, blue, scan, cfg)
+
+    return with_punct, rgb_to_hex(with_punct[0], with_punct[1], with_punct[2])
+
+
+@lru_cache(maxsize=CACHE.compute_results)
+def _compute_result(text: str, cfg: ComputeConfig) -> ComputeResult:
+    """Pure part of compute_color (steps 1–6); memoized per (text, computation settings), API errors propagate."""
+    rgb: RGB
+    hex_code: str
+    rgb, hex_code = _compute_rgb_hex(text, cfg)
+    return ComputeResult(rgb=rgb, hex=hex_code, name=_lookup_display_name(hex_code))
+
+
+def _result_for(text: str, compute_key: ComputeConfig) -> ComputeResult:
+    """Memoized result, or an uncached one carrying the HSV name while Color.Pizza is failing."""
+    api_errors: Tuple[Type[BaseException], ...] = _get_deps().api_errors
+    try:
+        return _compute_result(text, compute_key)
+    except api_errors:
+        rgb: RGB
+        hex_code: str
+        rgb, hex_code = _compute_rgb_hex(text, compute_key)
+        return ComputeResult(rgb=rgb, hex=hex_code, name=approx_color_name(rgb[0], rgb[1], rgb[2]))
+
+
+def compute_color(text: str, cfg: ComputeConfig = _DEFAULT_CONFIG) -> ComputeResult:
     """
     Compute the color for a text:
     1) normalize text
@@ -267,34 +448,47 @@ def compute_color(text: str, cfg: ComputeConfig = ComputeConfig()) -> ComputeRes
     5) apply punctuation modifiers
     6) resolve display name
     7) optionally speak
+
+    Steps 1–6 are memoized per text and computation settings; speaking runs on every call.
+    Empty or whitespace-only text skips steps 1–6 (and the cache) and is black, named locally.
     """
-    original_text: str = text
-    text_trans: str = transliterate_de(text)
+    result: ComputeResult = _BLANK_RESULT if not text or text.isspace() else _result_for(text, _compute_key(cfg))
+    _maybe_speak(text, result, cfg)
+    return result
 
-    base_rgb: RGB
-    base_count: int
 
-    if cfg.mode is ComputeMode.FREQ:
-        freq_result: Tuple[RGB, int] = _compute_rgb_freq(text_trans, cfg.denominator)
-        base_rgb = freq_result[0]
-        base_count = freq_result[1]
-        base_rgb = _apply_length_floor(base_rgb, base_count, cfg)
-    else:
-        base_rgb = _compute_rgb_anchor(text_trans)
+def compute_colors(texts: Sequence[str], cfg: ComputeConfig = _DEFAULT_CONFIG) -> list[ComputeResult]:
+    """
+    Compute colors for many texts at once (e.g. recoloring several sentences), without TTS.
 
-    with_override: RGB = _blend_override(base_rgb, text_trans)
-    with_punct: RGB = _apply_punctuation(with_override, original_text, cfg)
+    The cache key is derived from `cfg` once for the whole batch, duplicate texts
+    share one memoized result, and the display names of all colors not yet known to
+    the Color.Pizza client are fetched with a single request.
+    """
+    compute_key: ComputeConfig = _compute_key(cfg)
+    _prefetch_display_names(texts, compute_key)
+    results: list[ComputeResult] = [
+        _result_for(text, compute_key) if text and not text.isspace() else _BLANK_RESULT
+        for text in texts
+    ]
+    return results
 
-    hex_code: str = rgb_to_hex(with_punct[0], with_punct[1], with_punct[2])
-    display_name: str = _resolve_display_name(hex_code, with_punct)
 
-    result: ComputeResult = ComputeResult(rgb=with_punct, hex=hex_code, name=display_name)
-    _maybe_speak(original_text, result, cfg)
-    return result
+def clear_compute_cache() -> None:
+    """
+    Drop memoized results and display names (e.g. after installing the Color.Pizza client).
+
+    The optional name-resolution dependencies are probed again on the next lookup.
+    """
+    _compute_result.cache_clear()
+    _compute_rgb_hex.cache_clear()
+    _lookup_display_name.cache_clear()
+    _get_deps.cache_clear()
 
 
 def prepare_engine(cfg: ComputeConfig) -> None:
-    """Warm up TTS backend or start the async runner to avoid first-use latency."""
+    """Probe optional dependencies and warm up TTS backend or start the async runner to avoid first-use latency."""
+    _get_deps()
     if not cfg.speak_enabled:
         return
     if cfg.tts_async and cfg.tts_runner is not None:
@@ -5,22 +5,46 @@ Text normalization utilities.
 
 - `transliterate_de`: replace German umlauts/ß with ASCII equivalents.
 - `visible_len`: count non-whitespace characters.
-- `letters_only`: extract ASCII letters A–Z as a list of single-character strings.
+- `folded_letter_bytes`: extract ASCII letters A–Z as lowercase bytes (C-level, no per-char loop).
 """
 
-import re
+import string
 from typing import Final
 
 
 __all__ = [
     "transliterate_de",
     "visible_len",
-    "letters_only",
+    "folded_letter_bytes",
 ]
 
 
-# Precompiled pattern for ASCII letters
-ASCII_LETTERS_PATTERN: Final[re.Pattern[str]] = re.compile(r"[A-Za-z]")
+# German umlauts/ß → ASCII, applied in C by str.translate
+_DE_TRANSLITERATION_TABLE: Final[dict[int, str]] = str.maketrans(
+    {
+        "ä": "ae",
+        "ö": "oe",
+        "ü": "ue",
+        "Ä": "Ae",
+        "Ö": "Oe",
+        "Ü": "Ue",
+        "ß": "ss",
+    }
+)
+
+# Every code point for which str.isspace() is True lies below U+3001 (U+3000 is the last one);
+# tests/test_normalization.py checks this bound against every code point up to sys.maxunicode.
+_WHITESPACE_SCAN_END: Final[int] = 0x3001
+_WHITESPACE_DELETE_TABLE: Final[dict[int, None]] = dict.fromkeys(
+    (code_point for code_point in range(_WHITESPACE_SCAN_END) if chr(code_point).isspace()), None
+)
+
+# 256-entry byte tables: fold A–Z onto a–z and delete every byte that is not an ASCII letter
+_ASCII_LETTER_BYTES: Final[bytes] = string.ascii_letters.encode("ascii")
+_FOLD_TABLE: Final[bytes] = bytes.maketrans(
+    string.ascii_uppercase.encode("ascii"), string.ascii_lowercase.encode("ascii")
+)
+_NON_LETTER_BYTES: Final[bytes] = bytes(byte for byte in range(256) if byte not in _ASCII_LETTER_BYTES)
 
 
 def transliterate_de(text: str) -> str:
@@ -33,22 +57,7 @@ def transliterate_de(text: str) -> str:
     Returns:
         A new string with German-specific characters transliterated to ASCII.
     """
-    mapping: dict[str, str] = {
-        "ä": "ae",
-        "ö": "oe",
-        "ü": "ue",
-        "Ä": "Ae",
-        "Ö": "Oe",
-        "Ü": "Ue",
-        "ß": "ss",
-    }
-
-    output_chars: list[str] = []
-    for ch in text:
-        replacement: str = mapping.get(ch, ch)
-        output_chars.append(replacement)
-
-    result: str = "".join(output_chars)
+    result: str = text.translate(_DE_TRANSLITERATION_TABLE)
     return result
 
 
@@ -62,23 +71,23 @@ def visible_len(text: str) -> int:
     Returns:
         Number of characters for which `str.isspace()` is False.
     """
-    count: int = 0
-    for ch in text:
-        is_space: bool = ch.isspace()
-        if not is_space:
-            count += 1
-    return count
+    visible: str = text.translate(_WHITESPACE_DELETE_TABLE)
+    return len(visible)
 
 
-def letters_only(text: str) -> list[str]:
+def folded_letter_bytes(text: str) -> bytes:
     """
-    Return a list of ASCII letters (A–Z/a–z) found in the input text.
+    Return the ASCII letters (A–Z/a–z) of the input text as lowercase bytes.
+
+    Non-ASCII characters are dropped during encoding; folding and filtering happen
+    in a single `bytes.translate` pass, so counting a letter is a `bytes.count` call.
 
     Args:
         text: Arbitrary input string.
 
     Returns:
-        List of single-character strings containing only ASCII letters.
+        Lowercase ASCII letters in input order.
     """
-    matches: list[str] = ASCII_LETTERS_PATTERN.findall(text)
-    return matches
+    encoded: bytes = text.encode("ascii", "ignore")
+    letters: bytes = encoded.translate(_FOLD_TABLE, _NON_LETTER_BYTES)
+    return letters
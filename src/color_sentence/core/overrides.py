@@ -16,27 +16,58 @@ from color_sentence.config import overrides_config as o_cfg
 
 __all__: list[str] = ["find_override_and_weight"]
 
-_SUFFIX_GROUP_INDEX: Final[int] = 1
 
+def _compile_fused_pattern(stems_by_key: dict[str, list[str]], suffixes: list[str]) -> re.Pattern[str]:
+    r"""
+    Build one regex matching every color stem, so the text is scanned once.
 
-def _compile_color_patterns(stems_by_key: dict[str, list[str]]) -> list[tuple[str, re.Pattern[str]]]:
+    The pattern shape is:  \b(?=[<first letters>])(?:((?:<stems of key 0>)(?:(<suffix 0>)|...)?)|...)\w*
+    Stems are ordered longest first, so none loses against one of its prefixes; suffixes must be
+    passed in the same order (see _SUFFIXES).
+    The first-letter lookahead rejects most word starts before the per-key groups are tried.
+    Raises ValueError if a stem is a prefix of a stem of a later color key, which the
+    per-key grouping could not order correctly.
     """
-    Build regex patterns for each color stem.
-
-    The pattern shape is:  \b<stem>(farben|farbig|stichig|lich)?\w*
-    """
-    patterns: list[tuple[str, re.Pattern[str]]] = []
-    for color_key, stems in stems_by_key.items():
-        for stem in stems:
-            pattern_source: str = rf"\b{re.escape(stem)}(farben|farbig|stichig|lich)?\w*"
-            compiled_pattern: re.Pattern[str] = re.compile(pattern_source, re.IGNORECASE)
-            patterns.append((color_key, compiled_pattern))
-    return patterns
-
-
-_COLOR_PATTERNS: Final[list[tuple[str, re.Pattern[str]]]] = _compile_color_patterns(
-    o_cfg.OVERRIDE_COLOR_STEMS
+    suffix_alternation: str = "|".join(f"({re.escape(suffix)})" for suffix in suffixes)
+    color_groups: list[str] = []
+    seen_stems: list[str] = []
+    for stems in stems_by_key.values():
+        lowered_stems: list[str] = [stem.lower() for stem in stems]
+        for stem in lowered_stems:
+            for earlier_stem in seen_stems:
+                if stem.startswith(earlier_stem):
+                    raise ValueError(f"override stem {stem!r} is shadowed by earlier stem {earlier_stem!r}")
+        seen_stems.extend(lowered_stems)
+        ordered_stems: list[str] = sorted(stems, key=len, reverse=True)
+        stem_alternation: str = "|".join(re.escape(stem) for stem in ordered_stems)
+        color_groups.append(rf"((?:{stem_alternation})(?:{suffix_alternation})?)")
+    first_letters: str = "".join(sorted({stem[0] for stem in seen_stems}))
+    pattern_source: str = rf"\b(?=[{re.escape(first_letters)}])(?:{'|'.join(color_groups)})\w*"
+    return re.compile(pattern_source, re.IGNORECASE)
+
+
+# Longest first, so no suffix loses against one of its prefixes.
+_SUFFIXES: Final[list[str]] = sorted(
+    (suffix for suffix in o_cfg.OVERRIDE_SUFFIX_WEIGHTS if suffix != o_cfg.BASE_WORD_SUFFIX_KEY),
+    key=len,
+    reverse=True,
 )
+# Weight per suffix group offset (1-based, relative to the color group), in _SUFFIXES order.
+_SUFFIX_WEIGHT_BY_OFFSET: Final[tuple[tuple[int, float], ...]] = tuple(
+    (offset, o_cfg.OVERRIDE_SUFFIX_WEIGHTS[suffix]) for offset, suffix in enumerate(_SUFFIXES, start=1)
+)
+# Each color key gets one outer color group wrapping its stems, followed by one nested group per suffix
+# (in _SUFFIXES order). The outer group closes last, so Match.lastindex is always the color group and
+# its suffixes are groups lastindex + 1 ... lastindex + len(_SUFFIXES). Suffix weights are looked up by
+# group index, never by the matched text: under IGNORECASE, 'ſ' matches 's' and 'ı'/'İ' match 'i', so
+# the captured suffix need not equal any OVERRIDE_SUFFIX_WEIGHTS key.
+_GROUPS_PER_COLOR: Final[int] = 1 + len(_SUFFIXES)
+_FUSED_PATTERN: Final[re.Pattern[str]] = _compile_fused_pattern(o_cfg.OVERRIDE_COLOR_STEMS, _SUFFIXES)
+# Target RGB per color id, in the group order of _FUSED_PATTERN.
+_RGB_BY_GID: Final[tuple[RGB, ...]] = tuple(
+    o_cfg.OVERRIDE_COLOR_RGB[color_key] for color_key in o_cfg.OVERRIDE_COLOR_STEMS
+)
+_BASE_WEIGHT: Final[float] = o_cfg.OVERRIDE_SUFFIX_WEIGHTS[o_cfg.BASE_WORD_SUFFIX_KEY]
 
 
 def find_override_and_weight(text_trans: str) -> tuple[RGB, float] | None:
@@ -46,27 +77,28 @@ def find_override_and_weight(text_trans: str) -> tuple[RGB, float] | None:
     Returns:
         (rgb_avg, weight_avg) if matches exist; otherwise None.
     """
-    sum_red: float = 0.0
-    sum_green: float = 0.0
-    sum_blue: float = 0.0
+    sum_red: int = 0
+    sum_green: int = 0
+    sum_blue: int = 0
     sum_weight: float = 0.0
     match_count: int = 0
 
-    for color_key, pattern in _COLOR_PATTERNS:
-        for match in pattern.finditer(text_trans):
-            raw_suffix: str | None = match.group(_SUFFIX_GROUP_INDEX)
-            suffix: str = raw_suffix.lower() if raw_suffix is not None else o_cfg.BASE_WORD_SUFFIX_KEY
-
-            weight_for_match: float = o_cfg.OVERRIDE_SUFFIX_WEIGHTS.get(
-                suffix, o_cfg.OVERRIDE_SUFFIX_WEIGHTS[o_cfg.BASE_WORD_SUFFIX_KEY]
-            )
-
-            rgb_for_match: RGB = o_cfg.OVERRIDE_COLOR_RGB[color_key]
-            sum_red += float(rgb_for_match[0])
-            sum_green += float(rgb_for_match[1])
-            sum_blue += float(rgb_for_match[2])
-            sum_weight += weight_for_match
-            match_count += 1
+    for match in _FUSED_PATTERN.finditer(text_trans):
+        color_group: int | None = match.lastindex
+        if color_group is None:
+            continue
+        weight_for_match: float = _BASE_WEIGHT
+        for offset, suffix_weight in _SUFFIX_WEIGHT_BY_OFFSET:
+            if match.start(color_group + offset) != -1:
+                weight_for_match = suffix_weight
+                break
+
+        rgb_for_match: RGB = _RGB_BY_GID[(color_group - 1) // _GROUPS_PER_COLOR]
+        sum_red += rgb_for_match[0]
+        sum_green += rgb_for_match[1]
+        sum_blue += rgb_for_match[2]
+        sum_weight += weight_for_match
+        match_count += 1
 
     if match_count == 0:
         return None
@@ -76,11 +108,10 @@ def find_override_and_weight(text_trans: str) -> tuple[RGB, float] | None:
     avg_blue: int = int(round(sum_blue / float(match_count)))
     avg_weight: float = sum_weight / float(match_count)
 
-    base_weight: float = o_cfg.OVERRIDE_SUFFIX_WEIGHTS[o_cfg.BASE_WORD_SUFFIX_KEY]
     if avg_weight < 0.0:
         avg_weight = 0.0
-    elif avg_weight > base_weight:
-        avg_weight = base_weight
+    elif avg_weight > _BASE_WEIGHT:
+        avg_weight = _BASE_WEIGHT
 
     rgb_avg: RGB = (avg_red, avg_green, avg_blue)
     return rgb_avg, avg_weight
@@ -1,14 +1,59 @@
 from __future__ import annotations
 
+import atexit
+import json
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Final, Optional
+from threading import Lock
+from types import ModuleType
+from typing import Any, Final, Optional, Sequence
 
 import httpx
 
+# Optional accelerators (extra "speedups"): incremental parsing and faster JSON decoding.
+_ijson: ModuleType | None
+_orjson: ModuleType | None
+try:
+    import ijson as _ijson_module
+
+    _ijson = _ijson_module
+except ImportError:
+    _ijson = None
+try:
+    import orjson as _orjson_module
+
+    _orjson = _orjson_module
+except ImportError:
+    _orjson = None
+
 
 BASE_URL: Final[str] = "https://api.color.pizza/v1"
 REQUEST_TIMEOUT_SECONDS: Final[float] = 3.0
 HEADER_USER_AGENT: Final[str] = "color_sentence/0.1 (+https://example.invalid)"
+MAX_KEEPALIVE_CONNECTIONS: Final[int] = 8
+MAX_CONNECTIONS: Final[int] = 16
+LOOKUP_CACHE_SIZE: Final[int] = 1024
+# Upper bound of hex values per batch request, so the query string stays well below URL length limits.
+BATCH_MAX_VALUES: Final[int] = 100
+
+# ijson prefix of the entries in the Color.Pizza response ({"colors": [...]}).
+COLORS_ITEM_PREFIX: Final[str] = "colors.item"
+
+
+@dataclass(slots=True)
+class _ClientSlot:
+    """Holder for the shared client, so creating or closing it never rebinds a module global."""
+    client: httpx.Client | None = None
+
+
+# Shared client, created on first lookup so repeated lookups reuse pooled keep-alive connections.
+_CLIENT_SLOT: Final[_ClientSlot] = _ClientSlot()
+_CLIENT_LOCK: Final[Lock] = Lock()
+
+# Successful lookups per normalized hex, least recently used first. An explicit LRU (instead of
+# functools.lru_cache) so batch lookups can probe it per hex and seed it with their results.
+_LOOKUP_CACHE: Final[OrderedDict[str, ColorNameInfo]] = OrderedDict()
+_LOOKUP_CACHE_LOCK: Final[Lock] = Lock()
 
 
 @dataclass(frozen=True)
@@ -26,18 +71,66 @@ def _normalize_hex(hex_code: str) -> str:
     raw: str = hex_code.strip()
     cleaned: str = raw[1:] if raw.startswith("#") else raw
     cleaned = cleaned.strip()
-    if len(cleaned) != 6 or any(ch not in "0123456789abcdefABCDEF" for ch in cleaned):
+    # isalnum() rules out the separators bytes.fromhex() would skip; fromhex() then checks the digits in C.
+    if len(cleaned) != 6 or not (cleaned.isascii() and cleaned.isalnum()):
         raise ValueError(f"Invalid hex color: {hex_code!r} (expected 6 hex digits)")
+    try:
+        bytes.fromhex(cleaned)
+    except ValueError as exc:
+        raise ValueError(f"Invalid hex color: {hex_code!r} (expected 6 hex digits)") from exc
     return f"#{cleaned.upper()}"
 
 
-def _extract_first_name(payload: dict) -> Optional[ColorNameInfo]:
+def _cached_info(normalized_hex: str) -> Optional[ColorNameInfo]:
+    """Return the memoized lookup result for a normalized hex and mark it as recently used."""
+    with _LOOKUP_CACHE_LOCK:
+        info: Optional[ColorNameInfo] = _LOOKUP_CACHE.get(normalized_hex)
+        if info is not None:
+            _LOOKUP_CACHE.move_to_end(normalized_hex)
+        return info
+
+
+def _remember_info(normalized_hex: str, info: ColorNameInfo) -> None:
+    """Memoize a successful lookup, evicting the least recently used entries beyond LOOKUP_CACHE_SIZE."""
+    with _LOOKUP_CACHE_LOCK:
+        _LOOKUP_CACHE[normalized_hex] = info
+        _LOOKUP_CACHE.move_to_end(normalized_hex)
+        while len(_LOOKUP_CACHE) > LOOKUP_CACHE_SIZE:
+            _LOOKUP_CACHE.popitem(last=False)
+
+
+def clear_lookup_cache() -> None:
+    """Forget all memoized lookups; the next lookup of any color queries Color.Pizza again."""
+    with _LOOKUP_CACHE_LOCK:
+        _LOOKUP_CACHE.clear()
+
+
+def _extract_first_name(payload: dict[str, object]) -> Optional[ColorNameInfo]:
     """Extract the first color entry into a structured result."""
     colors = payload.get("colors")
     if not isinstance(colors, list) or not colors:
         return None
+    return _info_from_entry(colors[0])
+
+
+def _extract_all(payload: dict[str, object]) -> list[ColorNameInfo]:
+    """Extract every usable color entry, in response order."""
+    colors = payload.get("colors")
+    if not isinstance(colors, list):
+        return []
+    infos: list[ColorNameInfo] = []
+    for entry in colors:
+        info: Optional[ColorNameInfo] = _info_from_entry(entry)
+        if info is not None:
+            infos.append(info)
+    return infos
+
+
+def _info_from_entry(first: object) -> Optional[ColorNameInfo]:
+    """Convert one entry of the `colors` array into a structured result."""
+    if not isinstance(first, dict):
+        return None
 
-    first = colors[0]
     name_val = first.get("name")
     hex_val = first.get("hex")
     distance_val = first.get("distance")
@@ -63,10 +156,103 @@ def _extract_first_name(payload: dict) -> Optional[ColorNameInfo]:
     )
 
 
+def _decode_json(content: bytes) -> object:
+    """Decode a JSON body with orjson when installed, else the stdlib; both raise ValueError subclasses."""
+    if _orjson is not None:
+        return _orjson.loads(content)
+    return json.loads(content)
+
+
+def _stream_first_entry(resp: httpx.Response, ijson_module: ModuleType) -> object | None:
+    """
+    Parse the response body incrementally and stop parsing at the first element of `colors`.
+
+    The rest of the body is still read (not parsed), so the connection can return to the pool.
+
+    Raises:
+        ValueError: The body is not valid JSON before a first entry was found.
+    """
+    found: list[Any] = ijson_module.sendable_list()
+    parser = ijson_module.items_coro(found, COLORS_ITEM_PREFIX, use_float=True)
+    try:
+        for chunk in resp.iter_bytes():
+            if not found:
+                parser.send(chunk)
+    except ijson_module.JSONError as exc:
+        raise ValueError("Color.Pizza response is not valid JSON.") from exc
+    try:
+        parser.close()
+    except ijson_module.JSONError as exc:
+        # Expected after stopping early; only an error if nothing was parsed.
+        if not found:
+            raise ValueError("Color.Pizza response is not valid JSON.") from exc
+    return found[0] if found else None
+
+
+def _get_client() -> httpx.Client:
+    """Return the shared HTTP client, creating it on first use."""
+    client: httpx.Client | None = _CLIENT_SLOT.client
+    if client is not None:
+        return client
+    with _CLIENT_LOCK:
+        client = _CLIENT_SLOT.client
+        if client is None:
+            client = httpx.Client(
+                base_url=BASE_URL,
+                headers={"User-Agent": HEADER_USER_AGENT},
+                timeout=REQUEST_TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                    max_connections=MAX_CONNECTIONS,
+                ),
+            )
+            _CLIENT_SLOT.client = client
+        return client
+
+
+def close_client() -> None:
+    """Close the shared HTTP client and its pooled connections; the next lookup creates a new one."""
+    with _CLIENT_LOCK:
+        client: httpx.Client | None = _CLIENT_SLOT.client
+        _CLIENT_SLOT.client = None
+    if client is not None:
+        client.close()
+
+
+atexit.register(close_client)
+
+
+def _lookup(normalized_hex: str, timeout_seconds: float) -> ColorNameInfo:
+    """Query Color.Pizza for an already normalized hex (no cache involved)."""
+    params = {
+        "values": normalized_hex.lstrip("#"),
+        "goodnamesonly": "true",
+        "noduplicates": "true",
+    }
+
+    info: Optional[ColorNameInfo]
+    if _ijson is not None:
+        with _get_client().stream("GET", "/", params=params, timeout=timeout_seconds) as stream:
+            stream.raise_for_status()
+            info = _info_from_entry(_stream_first_entry(stream, _ijson))
+    else:
+        resp: httpx.Response = _get_client().get("/", params=params, timeout=timeout_seconds)
+        resp.raise_for_status()
+        payload: object = _decode_json(resp.content)
+        # A top-level array or scalar body carries no usable entry either.
+        info = _extract_first_name(payload) if isinstance(payload, dict) else None
+
+    if info is None:
+        raise RuntimeError("Color.Pizza response did not include a usable color name.")
+    return info
+
+
 def get_color_name_from_hex(hex_code: str, *, timeout_seconds: float = REQUEST_TIMEOUT_SECONDS) -> ColorNameInfo:
     """
     Resolve a human-friendly color name for a hex via Color.Pizza.
 
+    Repeated lookups of the same color within a process are answered from memory.
+
     Args:
         hex_code: '#RRGGBB' or 'RRGGBB'.
         timeout_seconds: HTTP timeout in seconds.
@@ -80,19 +266,72 @@ def get_color_name_from_hex(hex_code: str, *, timeout_seconds: float = REQUEST_T
         RuntimeError: Missing name in a syntactically valid response.
     """
     normalized_hex: str = _normalize_hex(hex_code)
+    cached: Optional[ColorNameInfo] = _cached_info(normalized_hex)
+    if cached is not None:
+        return cached
+    info: ColorNameInfo = _lookup(normalized_hex, timeout_seconds)
+    _remember_info(normalized_hex, info)
+    return info
+
+
+def _lookup_batch(normalized_hexes: Sequence[str], timeout_seconds: float) -> dict[str, ColorNameInfo]:
+    """Query Color.Pizza for several normalized hexes in one request; returns the usable entries per hex."""
+    # No "noduplicates" here: it would rename colors to keep names distinct within the batch,
+    # so results would differ from single lookups.
     params = {
-        "values": normalized_hex.lstrip("#"),
+        "values": ",".join(hex_code.lstrip("#") for hex_code in normalized_hexes),
         "goodnamesonly": "true",
-        "noduplicates": "true",
     }
-    headers = {"User-Agent": HEADER_USER_AGENT}
+    resp: httpx.Response = _get_client().get("/", params=params, timeout=timeout_seconds)
+    resp.raise_for_status()
+    payload: object = _decode_json(resp.content)
+    if not isinstance(payload, dict):
+        return {}
+    return {info.requested_hex: info for info in _extract_all(payload)}
 
-    with httpx.Client(base_url=BASE_URL, headers=headers, timeout=timeout_seconds) as client:
-        resp: httpx.Response = client.get("/", params=params)
-        resp.raise_for_status()
-        payload: dict = resp.json()
 
-    info = _extract_first_name(payload)
-    if info is None:
-        raise RuntimeError("Color.Pizza response did not include a usable color name.")
-    return info
+def get_color_names_from_hexes(
+    hex_codes: Sequence[str], *, timeout_seconds: float = REQUEST_TIMEOUT_SECONDS
+) -> list[ColorNameInfo]:
+    """
+    Resolve names for several hex colors, querying Color.Pizza once for all colors not yet memoized.
+
+    Fetched results are memoized per hex, so later get_color_name_from_hex calls for the
+    same colors are answered from memory. More than BATCH_MAX_VALUES uncached colors are
+    split across several requests.
+
+    Args:
+        hex_codes: '#RRGGBB' or 'RRGGBB' values; duplicates are requested once.
+        timeout_seconds: HTTP timeout in seconds.
+
+    Returns:
+        One ColorNameInfo per input, in input order.
+
+    Raises:
+        ValueError: Invalid hex input or unusable response structure.
+        httpx.HTTPError: Network/HTTP errors.
+        RuntimeError: A requested color is missing from the response (the others are still memoized).
+    """
+    normalized: list[str] = [_normalize_hex(hex_code) for hex_code in hex_codes]
+    info_by_hex: dict[str, ColorNameInfo] = {}
+    uncached: list[str] = []
+    for hex_code in dict.fromkeys(normalized):
+        cached: Optional[ColorNameInfo] = _cached_info(hex_code)
+        if cached is None:
+            uncached.append(hex_code)
+        else:
+            info_by_hex[hex_code] = cached
+
+    for start in range(0, len(uncached), BATCH_MAX_VALUES):
+        chunk: list[str] = uncached[start:start + BATCH_MAX_VALUES]
+        fetched: dict[str, ColorNameInfo] = _lookup_batch(chunk, timeout_seconds)
+        for hex_code in chunk:
+            info: Optional[ColorNameInfo] = fetched.get(hex_code)
+            if info is not None:
+                _remember_info(hex_code, info)
+                info_by_hex[hex_code] = info
+
+    missing: list[str] = [hex_code for hex_code in uncached if hex_code not in info_by_hex]
+    if missing:
+        raise RuntimeError(f"Color.Pizza response did not include usable names for {missing!r}.")
+    return [info_by_hex[hex_code] for hex_code in normalized]
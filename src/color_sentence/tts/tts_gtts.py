@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from color_sentence.config.audio_config import LINUX_PRIMARY_PLAYER, LINUX_FFMPEG, LINUX_APLAY, WAV_CODEC, WAV_CHANNELS, \
-    WAV_RATE_HZ, WINDOWS_PRIMARY_PLAYER, WINDOWS_POWERSHELL_CANDIDATES
+    WAV_RATE_HZ, WINDOWS_PRIMARY_PLAYER, WINDOWS_POWERSHELL_CANDIDATES, WAV_CACHE_MAX_BYTES
 
 """
 gTTS backend with a small on-disk cache.
@@ -10,29 +10,44 @@ Supported OS: Linux and Windows.
 
 Linux playback (in order):
   1) ffplay
-  2) ffmpeg -> WAV -> aplay
+  2) ffmpeg -> WAV -> aplay (the WAV is cached next to the MP3)
 
 Windows playback (in order):
   1) ffplay
-  2) PowerShell MediaPlayer (PresentationCore)
+  2) MCI via winmm.dll (in-process, no subprocess)
+  3) PowerShell MediaPlayer (PresentationCore)
 """
 
 from dataclasses import dataclass
-from hashlib import sha1
+from functools import lru_cache
+from hashlib import blake2b
 from pathlib import Path
+from typing import Final, NamedTuple
 
+import ctypes
 import errno
 import os
 import platform
+import re
 import shutil
 import subprocess
-import tempfile
+import sys
+import threading
+import time
 
 from gtts import gTTS
 from gtts.tts import gTTSError
 
 from color_sentence.config import config as cfg
-from color_sentence.config.types import ITTS
+from color_sentence.config.types import IPrefetchTTS
+
+CACHE_DIGEST_BYTES: Final[int] = 16  # 128-bit BLAKE2b → 32 hex chars per cache filename
+DIGEST_CACHE_SIZE: Final[int] = 256
+MCI_ALIAS_PREFIX: Final[str] = "color_sentence_"
+_MCI_OK: Final[int] = 0
+TEMP_FILE_PREFIX: Final[str] = "gtts_"  # in-progress files in the cache dir; never treated as cache entries
+# WAVs this cache names itself ("<fast|slow>_<digest>.wav"); eviction never touches other files in cache_dir.
+_CACHED_WAV_NAME: Final[re.Pattern[str]] = re.compile(rf"(?:fast|slow)_[0-9a-f]{{{CACHE_DIGEST_BYTES * 2}}}\.wav")
 
 
 def _prepare_text_for_gtts(text: str) -> str:
@@ -45,8 +60,45 @@ def _prepare_text_for_gtts(text: str) -> str:
     return stripped if (stripped and has_alnum) else "Hallo."
 
 
+class _Players(NamedTuple):
+    """Playback executables found on PATH for one OS family (None = not installed)."""
+    ffplay: str | None
+    ffmpeg: str | None
+    aplay: str | None
+    powershell: str | None
+
+
+@lru_cache(maxsize=None)
+def _resolve_players(system_name: str) -> _Players:
+    """
+    Look up the player binaries for an OS family once per process (PATH scans are costly).
+    """
+    if system_name.startswith("windows"):
+        return _Players(
+            ffplay=shutil.which(WINDOWS_PRIMARY_PLAYER),
+            ffmpeg=None,
+            aplay=None,
+            powershell=_first_available(WINDOWS_POWERSHELL_CANDIDATES),
+        )
+    return _Players(
+        ffplay=shutil.which(LINUX_PRIMARY_PLAYER),
+        ffmpeg=shutil.which(LINUX_FFMPEG),
+        aplay=shutil.which(LINUX_APLAY),
+        powershell=None,
+    )
+
+
+@lru_cache(maxsize=DIGEST_CACHE_SIZE)
+def _cache_digest(language: str, slow: bool, text: str) -> str:
+    """
+    Hash (language, slow, text) into the hex digest used in cache filenames; memoized for repeated sentences.
+    """
+    key: str = f"{language}|{slow}|{text}"
+    return blake2b(key.encode("utf-8"), digest_size=CACHE_DIGEST_BYTES).hexdigest()
+
+
 @dataclass
-class GttsSynthesizer(ITTS):
+class GttsSynthesizer(IPrefetchTTS):
     """
     Google Text-to-Speech with per-text MP3 caching.
     Minimal OS strategies; no macOS branch by design.
@@ -55,6 +107,9 @@ class GttsSynthesizer(ITTS):
     slow: bool = cfg.GTTS.slow
     cache_dir: Path | None = None
     _ready: bool = False
+    _cache_root: Path | None = None
+    _os: str | None = None
+    _players: _Players | None = None
 
     def warmup(self) -> None:
         """
@@ -63,8 +118,10 @@ class GttsSynthesizer(ITTS):
         if self._ready:
             return
 
-        cache_root: Path = self._resolve_cache_dir()
+        cache_root: Path = self._resolve_cache_dir().absolute()
         cache_root.mkdir(parents=True, exist_ok=True)
+        self._cache_root = cache_root
+        self._playback_setup()
 
         warm_text: str = cfg.GTTS.warmup_text
         sample_path: Path = self._cached_mp3_for_text(warm_text)
@@ -81,11 +138,22 @@ class GttsSynthesizer(ITTS):
         if not self._ready:
             self.warmup()
 
+        self.play(self.synthesize(text))
+
+    def synthesize(self, text: str) -> Path:
+        """
+        Return the cached MP3 for the text, synthesizing it first if missing (no playback).
+        """
         mp3_path: Path = self._cached_mp3_for_text(text)
         if not mp3_path.exists():
             self._synthesize_to(mp3_path, text)
+        return mp3_path
 
-        self._play_mp3(mp3_path)
+    def play(self, audio_path: Path) -> None:
+        """
+        Play an MP3 produced by synthesize.
+        """
+        self._play_mp3(audio_path)
 
     def _resolve_cache_dir(self) -> Path:
         """
@@ -110,10 +178,13 @@ class GttsSynthesizer(ITTS):
     def _cached_mp3_for_text(self, text: str) -> Path:
         """
         Build a stable cache filename for (language, slow, text).
+        The cache dir is resolved once (normally by warmup) and then reused; the path is absolute.
         """
-        cache_root: Path = self._resolve_cache_dir()
-        key: str = f"{self.language}|{self.slow}|{text}"
-        digest: str = sha1(key.encode("utf-8")).hexdigest()
+        cache_root: Path | None = self._cache_root
+        if cache_root is None:
+            cache_root = self._resolve_cache_dir().absolute()
+            self._cache_root = cache_root
+        digest: str = _cache_digest(self.language, self.slow, text)
         filename: str = f"{'slow' if self.slow else 'fast'}_{digest}.mp3"
         return cache_root / filename
 
@@ -128,74 +199,88 @@ class GttsSynthesizer(ITTS):
         target_dir.mkdir(parents=True, exist_ok=True)
 
         # Temp-Datei im *Zielordner* erzeugen → kein Cross-Device-Problem
-        tmp_handle = tempfile.NamedTemporaryFile(
-            prefix="gtts_", suffix=".mp3", dir=str(target_dir), delete=False
-        )
-        tmp_path: Path = Path(tmp_handle.name)
-        tmp_handle.close()
+        tmp_path: Path = _temp_path_in(target_dir, ".mp3")
 
+        renamed: bool = False
         try:
             engine = gTTS(text=safe_text, lang=self.language, slow=self.slow)  # type: ignore[name-defined]
             engine.save(str(tmp_path))
             try:
-                tmp_path.replace(target_mp3)
+                os.replace(tmp_path, target_mp3)
             except OSError:
                 shutil.move(str(tmp_path), str(target_mp3))
+            renamed = True
         except gTTSError as exc:  # type: ignore[name-defined]
             raise RuntimeError(f"gTTS network error: {exc}") from exc
         except OSError as exc:
             raise RuntimeError(f"File I/O during synthesis failed: {exc}") from exc
         finally:
-            try:
-                tmp_path.unlink(missing_ok=True)
-            except FileNotFoundError:
-                pass
-            except PermissionError:
-                pass
+            # Any failure (also ValueError from gTTS or KeyboardInterrupt) must not orphan the temp file.
+            if not renamed:
+                _safe_unlink(tmp_path)
+
+    def _playback_setup(self) -> tuple[str, _Players]:
+        """
+        Return the OS family and its player binaries; resolved on first use (normally in warmup).
+        """
+        system_name: str | None = self._os
+        players: _Players | None = self._players
+        if system_name is None or players is None:
+            system_name = platform.system().lower()
+            players = _resolve_players(system_name)
+            self._os = system_name
+            self._players = players
+        return system_name, players
 
     def _play_mp3(self, mp3_path: Path) -> None:
         """
         Dispatch to platform playback.
         """
-        system_name: str = platform.system().lower()
+        system_name: str
+        players: _Players
+        system_name, players = self._playback_setup()
         if system_name.startswith("linux"):
-            self._play_linux(mp3_path)
+            self._play_linux(mp3_path, players)
             return
         if system_name.startswith("windows"):
-            self._play_windows(mp3_path)
+            self._play_windows(mp3_path, players)
             return
         raise RuntimeError(f"Unsupported OS for playback: {system_name!r}")
 
-    def _play_linux(self, mp3_path: Path) -> None:
+    def _play_linux(self, mp3_path: Path, players: _Players) -> None:
         """
-        ffplay if available; otherwise ffmpeg->WAV->aplay.
+        ffplay if available; otherwise ffmpeg->WAV->aplay, reusing a cached WAV when present.
         """
-        ffplay_bin: str | None = shutil.which(LINUX_PRIMARY_PLAYER)
+        ffplay_bin: str | None = players.ffplay
         if ffplay_bin is not None:
             args: list[str] = [ffplay_bin, "-nodisp", "-autoexit", "-loglevel", "quiet", str(mp3_path)]
             _run_checked(args)
             return
 
-        ffmpeg_bin: str | None = shutil.which(LINUX_FFMPEG)
-        aplay_bin: str | None = shutil.which(LINUX_APLAY)
-        if ffmpeg_bin is None or aplay_bin is None:
+        ffmpeg_bin: str | None = players.ffmpeg
+        aplay_bin: str | None = players.aplay
+        wav_path: Path = mp3_path.with_suffix(".wav")
+        wav_cached: bool = wav_path.exists()
+        if aplay_bin is None or (ffmpeg_bin is None and not wav_cached):
             raise RuntimeError("Linux playback unavailable. Install 'ffplay' or both 'ffmpeg' and 'aplay'.")
 
-        wav_path: Path = self._mp3_to_wav(mp3_path, ffmpeg_bin)
-        try:
-            args_play: list[str] = [aplay_bin, "-q", str(wav_path)]
-            _run_checked(args_play)
-        finally:
-            _safe_unlink(wav_path)
+        if wav_cached:
+            _touch(wav_path)
+        elif ffmpeg_bin is not None:
+            self._mp3_to_wav(mp3_path, wav_path, ffmpeg_bin)
+            _evict_wavs(wav_path.parent, keep=wav_path)
+
+        args_play: list[str] = [aplay_bin, "-q", str(wav_path)]
+        _run_checked(args_play)
 
     @staticmethod
-    def _mp3_to_wav(mp3_path: Path, ffmpeg_bin: str) -> Path:
+    def _mp3_to_wav(mp3_path: Path, wav_path: Path, ffmpeg_bin: str) -> None:
         """
-        Convert MP3 to a temporary WAV (mono 22.05kHz) compatible with aplay.
+        Convert MP3 to a WAV (mono 22.05kHz) compatible with aplay.
+        ffmpeg writes a temp file in the target directory that then replaces `wav_path`,
+        so an interrupted conversion never leaves a truncated WAV in the cache.
         """
-        tmp = tempfile.NamedTemporaryFile(prefix="gtts_", suffix=".wav", delete=False)
-        wav_path: Path = Path(tmp.name)
-        tmp.close()
+        tmp_path: Path = _temp_path_in(wav_path.parent, ".wav")
 
         cmd: list[str] = [
             ffmpeg_bin,
@@ -210,40 +295,81 @@ class GttsSynthesizer(ITTS):
             WAV_CHANNELS,
             "-ar",
             WAV_RATE_HZ,
-            str(wav_path),
+            str(tmp_path),
         ]
-        _run_checked(cmd)
-        return wav_path
+        renamed: bool = False
+        try:
+            _run_checked(cmd)
+            os.replace(tmp_path, wav_path)
+            renamed = True
+        except OSError as exc:
+            raise RuntimeError(f"Caching converted WAV failed: {exc}") from exc
+        finally:
+            if not renamed:
+                _safe_unlink(tmp_path)
 
     @staticmethod
-    def _play_windows(mp3_path: Path) -> None:
+    def _play_windows(mp3_path: Path, players: _Players) -> None:
         """
-        ffplay if available; otherwise PowerShell MediaPlayer.
+        ffplay if available; otherwise MCI (winmm.dll); PowerShell MediaPlayer as last resort.
         """
-        ffplay_bin: str | None = shutil.which(WINDOWS_PRIMARY_PLAYER)
+        ffplay_bin: str | None = players.ffplay
         if ffplay_bin is not None:
             args: list[str] = [ffplay_bin, "-nodisp", "-autoexit", "-loglevel", "quiet", str(mp3_path)]
             _run_checked(args)
             return
 
-        powershell_bin: str | None = _first_available(WINDOWS_POWERSHELL_CANDIDATES)
+        if _play_windows_mci(mp3_path):
+            return
+
+        powershell_bin: str | None = players.powershell
         if powershell_bin is None:
             raise RuntimeError("PowerShell not found on PATH; cannot play MP3 on Windows.")
 
-        uri_str: str = mp3_path.resolve().as_uri()
+        # Cache paths are already absolute (_cached_mp3_for_text), as Path.as_uri() requires.
+        uri_str: str = mp3_path.as_uri()
+        # Event-driven wait: MediaPlayer raises its events through the WPF dispatcher, so the
+        # script pumps it with PushFrame until MediaEnded/MediaFailed ends the frame.
         ps_script: str = rf"""
 Add-Type -AssemblyName PresentationCore
+Add-Type -AssemblyName WindowsBase
 $player = New-Object System.Windows.Media.MediaPlayer
-$player.Open([Uri] '{uri_str}')
-$player.Volume = 1.0
-$player.Play()
-while (-not $player.NaturalDuration.HasTimeSpan) {{ Start-Sleep -Milliseconds 50 }}
-while ($player.Position -lt $player.NaturalDuration.TimeSpan) {{ Start-Sleep -Milliseconds 100 }}
+$frame = New-Object System.Windows.Threading.DispatcherFrame
+$player.add_MediaEnded({{ $frame.Continue = $false }})
+$player.add_MediaFailed({{ $frame.Continue = $false }})
+try {{
+    $player.Open([Uri] '{uri_str}')
+    $player.Volume = 1.0
+    $player.Play()
+    [System.Windows.Threading.Dispatcher]::PushFrame($frame)
+}} finally {{
+    $player.Close()
+}}
 """
         args_ps: list[str] = [powershell_bin, "-NoProfile", "-Command", ps_script]
         _run_checked(args_ps)
 
 
+def _play_windows_mci(mp3_path: Path) -> bool:
+    """
+    Play an MP3 synchronously through the Windows MCI API (in-process).
+    Returns False if MCI cannot open the file, so the caller can fall back.
+    """
+    if sys.platform != "win32":
+        return False
+
+    send_command = ctypes.windll.winmm.mciSendStringW
+    alias: str = f"{MCI_ALIAS_PREFIX}{threading.get_ident()}"  # one device per playing thread
+    if send_command(f'open "{mp3_path}" type mpegvideo alias {alias}', None, 0, None) != _MCI_OK:
+        return False
+    try:
+        if send_command(f"play {alias} wait", None, 0, None) != _MCI_OK:
+            raise RuntimeError(f"MCI playback failed for {mp3_path.name!r}")
+    finally:
+        send_command(f"close {alias}", None, 0, None)
+    return True
+
+
 def _first_available(candidates: tuple[str, ...]) -> str | None:
     """
     Return first executable from PATH among candidates.
@@ -268,6 +394,51 @@ def _run_checked(cmd: list[str]) -> None:
         raise RuntimeError(f"Command failed: {cmd!r} (exit {exc.returncode})") from exc
 
 
+def _temp_path_in(directory: Path, suffix: str) -> Path:
+    """
+    Return a unique temp file path in `directory` without creating the file.
+    pid, thread id and a monotonic timestamp keep concurrent writers apart.
+    """
+    unique: str = f"{os.getpid()}_{threading.get_ident()}_{time.monotonic_ns()}"
+    return directory / f"{TEMP_FILE_PREFIX}{unique}{suffix}"
+
+
+def _touch(path: Path) -> None:
+    """
+    Mark a cache file as recently used (its mtime orders WAV cache eviction).
+    """
+    try:
+        os.utime(path)
+    except OSError:
+        return
+
+
+def _evict_wavs(cache_root: Path, keep: Path) -> None:
+    """
+    Delete least recently used cached WAVs in cache_root until their total size fits WAV_CACHE_MAX_BYTES.
+    """
+    entries: list[tuple[float, int, Path]] = []
+    total_bytes: int = 0
+    for wav_file in cache_root.glob("*_*.wav"):
+        if _CACHED_WAV_NAME.fullmatch(wav_file.name) is None:
+            continue
+        try:
+            stat_result: os.stat_result = wav_file.stat()
+        except OSError:
+            continue
+        entries.append((stat_result.st_mtime, stat_result.st_size, wav_file))
+        total_bytes += stat_result.st_size
+
+    entries.sort()
+    for _mtime, size_bytes, wav_file in entries:
+        if total_bytes <= WAV_CACHE_MAX_BYTES:
+            return
+        if wav_file == keep:
+            continue
+        _safe_unlink(wav_file)
+        total_bytes -= size_bytes
+
+
 def _safe_unlink(path: Path) -> None:
     """
     Best-effort file deletion with narrow exception handling.
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
 """
-Lightweight TTS runner: a single background thread with a FIFO queue.
+Lightweight TTS runner: a single background thread with a bounded FIFO.
 Engine enqueues sentences; worker calls the synchronous ITTS backend.
+For backends that split synthesis and playback (IPrefetchTTS), the next queued
+sentence is already synthesized while the current one plays.
 """
 
+from collections import deque
+from concurrent.futures import Future
 from dataclasses import dataclass
-from queue import Queue, Full, Empty
+from pathlib import Path
 from threading import Event, Thread
-from typing import Protocol
+from typing import Callable, Protocol, TypeVar
 
-from color_sentence.config.types import ITTS
+from color_sentence.config.types import ITTS, IPrefetchTTS
+
+_Arg = TypeVar("_Arg")
+_Result = TypeVar("_Result")
 
 
 class ITTSRunner(Protocol):
@@ -24,58 +31,112 @@ class ITTSRunner(Protocol):
 class TtsRunner(ITTSRunner):
     """
     Single-threaded speech runner that calls a blocking ITTS in the background.
+    The worker sleeps until a sentence is enqueued; a full queue drops its oldest sentence.
     """
     backend: ITTS
     max_queue: int = 32
-    _queue: Queue[str] | None = None
+    _pending: deque[str] | None = None
+    _wake: Event | None = None
     _thread: Thread | None = None
     _stop: Event | None = None
 
     def ensure_started(self) -> None:
         if self._thread is not None:
             return
-        q: Queue[str] = Queue(self.max_queue)
+        pending: deque[str] = deque(maxlen=self.max_queue)
+        wake: Event = Event()
         stop: Event = Event()
-        t: Thread = Thread(target=self._loop, args=(q, stop), daemon=True)
-        self._queue = q
+        t: Thread = Thread(target=self._loop, args=(pending, wake, stop), daemon=True)
+        self._pending = pending
+        self._wake = wake
         self._stop = stop
         t.start()
         self._thread = t
 
     def enqueue(self, text: str) -> None:
         self.ensure_started()
-        assert self._queue is not None
-        try:
-            self._queue.put_nowait(text)
-        except Full:
-            try:
-                _ = self._queue.get_nowait()
-            except Empty:
-                pass
-            self._queue.put_nowait(text)
+        assert self._pending is not None and self._wake is not None
+        self._pending.append(text)  # maxlen: drops the oldest sentence when full
+        self._wake.set()
 
     def shutdown(self) -> None:
         if self._stop is not None:
             self._stop.set()
+        if self._wake is not None:
+            self._wake.set()
         if self._thread is not None:
             self._thread.join(timeout=0.5)
-        self._queue = None
+        self._pending = None
+        self._wake = None
         self._thread = None
         self._stop = None
 
 
-    def _loop(self, q: Queue[str], stop: Event) -> None:
+    def _loop(self, pending: deque[str], wake: Event, stop: Event) -> None:
         try:
             self.backend.warmup()
         except RuntimeError:
             pass
 
+        if isinstance(self.backend, IPrefetchTTS):
+            self._loop_prefetch(self.backend, pending, wake, stop)
+        else:
+            self._loop_speak(pending, wake, stop)
+
+    def _loop_speak(self, pending: deque[str], wake: Event, stop: Event) -> None:
         while not stop.is_set():
-            try:
-                text: str = q.get(timeout=0.1)
-            except Empty:
+            if not pending:
+                # Block until enqueue/shutdown; the deque is re-checked after clearing, so no wakeup is lost.
+                wake.wait()
+                wake.clear()
                 continue
             try:
-                self.backend.speak(text)
+                self.backend.speak(pending.popleft())
             except RuntimeError:
                 pass
+
+    def _loop_prefetch(self, backend: IPrefetchTTS, pending: deque[str], wake: Event, stop: Event) -> None:
+        # Synthesis and playback run on daemon threads; this loop only hands items between them, so an
+        # item queued during playback is synthesized right away. At most one item is synthesized ahead.
+        ahead: Future[Path] | None = None
+        playing: Future[None] | None = None
+        while not stop.is_set():
+            # Clear before inspecting: every state change after this point sets wake again.
+            wake.clear()
+            if playing is not None and playing.done():
+                playing = None
+            if ahead is None and pending:
+                ahead = _start_daemon(backend.synthesize, pending.popleft(), wake)
+            if playing is None and ahead is not None and ahead.done():
+                finished: Future[Path] = ahead
+                ahead = None
+                try:
+                    audio_path: Path = finished.result()
+                except RuntimeError:
+                    continue
+                playing = _start_daemon(backend.play, audio_path, wake)
+                continue
+            wake.wait()
+
+
+def _start_daemon(work: Callable[[_Arg], _Result], argument: _Arg, wake: Event) -> Future[_Result]:
+    """
+    Run work(argument) on a daemon thread and set `wake` when it finishes.
+
+    Unlike a ThreadPoolExecutor worker, the thread is not joined at interpreter exit,
+    so a synthesis or playback still in flight never delays shutdown.
+    """
+    future: Future[_Result] = Future()
+    future.add_done_callback(lambda _done: wake.set())
+
+    def run() -> None:
+        future.set_running_or_notify_cancel()
+        try:
+            result: _Result = work(argument)
+        except Exception as exc:  # handed to the runner loop via the future
+            future.set_exception(exc)
+            return
+        future.set_result(result)
+
+    Thread(target=run, daemon=True).start()
+    return future
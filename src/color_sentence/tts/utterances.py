@@ -5,6 +5,7 @@ Build short, human-friendly utterances for TTS output.
 Keep this independent from the TTS backend to allow reuse in CLI/GUI.
 """
 
+from functools import lru_cache
 from typing import Final
 from color_sentence.config.types import ComputeResult
 
@@ -14,14 +15,29 @@ GERMAN_CLOSE_QUOTE: Final[str] = "“"
 EN_OPEN_QUOTE: Final[str] = "“"
 EN_CLOSE_QUOTE: Final[str] = "”"
 
-
-def _quote(text: str, locale: str) -> str:
+GERMAN_FAMILY: Final[str] = "de"
+ENGLISH_FAMILY: Final[str] = "en"
+LOCALE_CACHE_SIZE: Final[int] = 32
+
+# (locale family, include_hex) -> sentence template; q = quoted sentence, n = color name, h = hex.
+_TEMPLATES: Final[dict[tuple[str, bool], str]] = {
+    (GERMAN_FAMILY, True): "Der Satz {q} hat die Farbe {n} {h}.",
+    (GERMAN_FAMILY, False): "Der Satz {q} hat die Farbe {n}.",
+    (ENGLISH_FAMILY, True): "The sentence {q} has the color {n} {h}.",
+    (ENGLISH_FAMILY, False): "The sentence {q} has the color {n}.",
+}
+_QUOTES: Final[dict[str, tuple[str, str]]] = {
+    GERMAN_FAMILY: (GERMAN_OPEN_QUOTE, GERMAN_CLOSE_QUOTE),
+    ENGLISH_FAMILY: (EN_OPEN_QUOTE, EN_CLOSE_QUOTE),
+}
+
+
+@lru_cache(maxsize=LOCALE_CACHE_SIZE)
+def _locale_family(locale: str) -> str:
     """
-    Quote text according to the locale.
+    Map a locale tag to the phrasing family: German for "de*", English otherwise.
     """
-    if locale.lower().startswith("de"):
-        return f"{GERMAN_OPEN_QUOTE}{text}{GERMAN_CLOSE_QUOTE}"
-    return f"{EN_OPEN_QUOTE}{text}{EN_CLOSE_QUOTE}"
+    return GERMAN_FAMILY if locale.lower().startswith(GERMAN_FAMILY) else ENGLISH_FAMILY
 
 
 def make_tts_sentence(original: str, result: ComputeResult, *, locale: str = "de-DE", include_hex: bool = True) -> str:
@@ -39,13 +55,7 @@ def make_tts_sentence(original: str, result: ComputeResult, *, locale: str = "de
     Returns:
         A locale-appropriate sentence ready for TTS.
     """
-    quoted: str = _quote(original, locale)
-
-    if locale.lower().startswith("de"):
-        if include_hex:
-            return f"Der Satz {quoted} hat die Farbe {result.name} {result.hex}."
-        return f"Der Satz {quoted} hat die Farbe {result.name}."
-    else:
-        if include_hex:
-            return f"The sentence {quoted} has the color {result.name} {result.hex}."
-        return f"The sentence {quoted} has the color {result.name}."
\ No newline at end of file
+    family: str = _locale_family(locale)
+    quotes: tuple[str, str] = _QUOTES[family]
+    quoted: str = f"{quotes[0]}{original}{quotes[1]}"
+    return _TEMPLATES[(family, include_hex)].format(q=quoted, n=result.name, h=result.hex)
@@ -8,11 +8,15 @@ Command-line interface for computing a color from input text.
 """
 
 import argparse
+from typing import Final
 
 from color_sentence.core.engine import compute_color, prepare_engine
 from color_sentence.config.types import Denominator, ComputeMode, ComputeResult
 
 DEFAULT_CONFIG: ComputeConfig = ComputeConfig()
+# Enum members are fixed at class definition, so the choices are built once at import.
+_DENOM_CHOICES: Final[tuple[str, ...]] = tuple(d.value for d in Denominator)
+_MODE_CHOICES: Final[tuple[str, ...]] = tuple(m.value for m in ComputeMode)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -26,13 +30,10 @@ def build_parser() -> argparse.ArgumentParser:
         description="Compute a representative color from a sentence."
     )
 
-    denominator_choices: list[str] = [d.value for d in Denominator]
-    mode_choices: list[str] = [m.value for m in ComputeMode]
-
     parser.add_argument("text", help="Input sentence to analyze.")
     parser.add_argument(
         "--denom",
-        choices=denominator_choices,
+        choices=_DENOM_CHOICES,
         default=DEFAULT_CONFIG.denominator.value,
         help="Normalization base for frequency mode.",
     )
@@ -48,7 +49,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--mode",
-        choices=mode_choices,
+        choices=_MODE_CHOICES,
         default=ComputeMode.FREQ.value,
         help="Computation mode: 'freq' (letter frequency) or 'anchor' (alphabet anchors).",
     )
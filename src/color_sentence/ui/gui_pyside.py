@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import replace
+from typing import Final
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
     QApplication,
@@ -31,16 +32,54 @@ from color_sentence.config.gui_config import (
     BUTTON_SIZE_PX,
     COLOR_BOX_MIN_W,
     COLOR_BOX_MIN_H,
-    LUMINANCE_DARK_TEXT_THRESHOLD,
+    LUMA_SHIFT,
+    LUMA_WEIGHT_R,
+    LUMA_WEIGHT_G,
+    LUMA_WEIGHT_B,
+    LUMINANCE_DARK_TEXT_THRESHOLD_INT,
 )
 
 
+# Color box style; filled via str.format with the background and text colors.
+_BOX_STYLE_TEMPLATE: Final[str] = (
+    "QLabel {{ background:{background}; color:{foreground}; border-radius:10px; padding:8px; }}"
+)
+
+
+class _ComputeSignals(QObject):
+    """Signals of a background computation; delivered to the GUI thread via queued connections."""
+    finished = Signal(ComputeResult)
+    done = Signal()
+
+
+class _ComputeTask(QRunnable):
+    """Run compute_color off the GUI thread (name lookup and TTS enqueue may block)."""
+
+    def __init__(self, text: str, cfg: ComputeConfig, signals: _ComputeSignals) -> None:
+        super().__init__()
+        self._text: str = text
+        self._cfg: ComputeConfig = cfg
+        self._signals: _ComputeSignals = signals
+
+    def run(self) -> None:
+        """Compute the color and report back; `done` fires even if the computation raised."""
+        try:
+            result: ComputeResult = compute_color(self._text, self._cfg)
+            self._signals.finished.emit(result)
+        finally:
+            self._signals.done.emit()
+
+
 class MainWindow(QMainWindow):
     """PySide6 GUI for the Color Sentence app."""
 
     def __init__(self) -> None:
         super().__init__()
         self._cfg: ComputeConfig = ComputeConfig()
+        self._last_box_style: str = ""
+        self._compute_signals: _ComputeSignals = _ComputeSignals()
+        self._compute_signals.finished.connect(self._update_result)
+        self._compute_signals.done.connect(self._on_compute_done)
         self._init_window()
         self._create_fonts()
         self._create_widgets()
@@ -143,20 +182,22 @@ class MainWindow(QMainWindow):
     def _apply_box_style(self, hex_code: str, *, dark_text: bool) -> None:
         """Apply background color and readable foreground to the color box."""
         text_color: str = "#000000" if dark_text else "white"
-        self.color_box.setStyleSheet(
-            "QLabel { "
-            f"background:{hex_code}; color:{text_color}; "
-            "border-radius:10px; padding:8px; }"
-        )
-        self.color_box.setText(hex_code)
+        style: str = _BOX_STYLE_TEMPLATE.format(background=hex_code, foreground=text_color)
+        # setStyleSheet makes Qt reparse and repolish; skip it (and setText) when nothing changed.
+        if style != self._last_box_style:
+            self.color_box.setStyleSheet(style)
+            self._last_box_style = style
+        if self.color_box.text() != hex_code:
+            self.color_box.setText(hex_code)
 
     def _update_result(self, result: ComputeResult) -> None:
         """Update labels and color box from a ComputeResult."""
         red: int = result.rgb[0]
         green: int = result.rgb[1]
         blue: int = result.rgb[2]
-        luminance: float = 0.2126 * float(red) + 0.7152 * float(green) + 0.0722 * float(blue)
-        use_dark_text: bool = luminance > LUMINANCE_DARK_TEXT_THRESHOLD
+        # Luminance in 8.8 fixed point, compared against the threshold on the same scale.
+        luminance_fixed: int = LUMA_WEIGHT_R * red + LUMA_WEIGHT_G * green + LUMA_WEIGHT_B * blue
+        use_dark_text: bool = luminance_fixed > LUMINANCE_DARK_TEXT_THRESHOLD_INT << LUMA_SHIFT
         self._apply_box_style(result.hex, dark_text=use_dark_text)
         self.hex_label.setText(f"Hex: {result.hex}")
         self.name_label.setText(f"Name: {result.name}")
@@ -168,12 +209,17 @@ class MainWindow(QMainWindow):
         self._cfg = replace(self._cfg, mode=mode)
 
     def _on_compute(self) -> None:
-        """Compute color for the input text and update the UI."""
+        """Start computing the color for the input text; the result arrives via `_update_result`."""
         text: str = self.input_edit.text().strip()
         if not text:
             return
-        result: ComputeResult = compute_color(text, self._cfg)
-        self._update_result(result)
+        self.compute_btn.setEnabled(False)  # one computation in flight at a time
+        task: _ComputeTask = _ComputeTask(text, self._cfg, self._compute_signals)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_compute_done(self) -> None:
+        """Re-enable the compute button once the background computation has finished."""
+        self.compute_btn.setEnabled(True)
 
 
 def run() -> None:
@@ -2,7 +2,36 @@
 from __future__ import annotations
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 ROOT: Path = Path(__file__).resolve().parents[1]
 SRC: Path = ROOT / "src"
 sys.path.insert(0, str(SRC))
+
+from color_sentence import ComputeConfig, clear_compute_cache, compute_color, prepare_engine  # noqa: E402
+
+# A None entry in sys.modules makes importing the Color.Pizza client raise ImportError.
+_COLOR_API_MODULE: str = "color_sentence.net.color_api"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _offline_color_names() -> Iterator[None]:
+    """Namensauflösung ohne Color.Pizza: alle Tests nutzen die lokale HSV-Heuristik, kein Netzwerk."""
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setitem(sys.modules, _COLOR_API_MODULE, None)
+        clear_compute_cache()
+        yield
+    clear_compute_cache()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_engine(_offline_color_names: None) -> None:
+    """Einmalige Kosten (Imports, Modul-Tabellen, erste Berechnung) vor dem ersten Test bezahlen."""
+    cfg: ComputeConfig = ComputeConfig(punctuation_mods=False, apply_length_floor=False)
+    prepare_engine(cfg)
+    compute_color("warmup", cfg)
@@ -0,0 +1,156 @@
+# tests/test_color_api.py
+from __future__ import annotations
+from functools import partial
+from typing import TYPE_CHECKING, TypeAlias
+
+import httpx
+import pytest
+
+from color_sentence.net import color_api
+from color_sentence.net.color_api import (
+    clear_lookup_cache,
+    close_client,
+    get_color_name_from_hex,
+    get_color_names_from_hexes,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+_FIRST_ENTRY: bytes = b'{"colors": [{"name": "Red", "hex": "#FF0000", "requestedHex": "#FF0001", "distance": 0.5}'
+_TAIL: bytes = b', {"name": "Other", "hex": "#00FF00", "requestedHex": "#00FF00", "distance": 1.0}]}'
+
+_Handler: TypeAlias = "Callable[[httpx.Request], httpx.Response]"
+_UseHandler: TypeAlias = "Callable[[_Handler], None]"
+
+
+@pytest.fixture
+def mock_api(monkeypatch: pytest.MonkeyPatch) -> Iterator[_UseHandler]:
+    """Color.Pizza über MockTransport mit leerem Lookup-Cache; liefert eine Funktion zum Setzen des Handlers."""
+    close_client()
+    clear_lookup_cache()
+
+    def use_handler(handler: _Handler) -> None:
+        monkeypatch.setattr(httpx, "Client", partial(httpx.Client, transport=httpx.MockTransport(handler)))
+
+    yield use_handler
+    close_client()
+    clear_lookup_cache()
+
+
+@pytest.fixture
+def buffered_api(mock_api: _UseHandler, monkeypatch: pytest.MonkeyPatch) -> _UseHandler:
+    """Wie mock_api, aber ohne ijson: der Body wird gepuffert und als Ganzes dekodiert."""
+    monkeypatch.setattr(color_api, "_ijson", None)
+    return mock_api
+
+
+def test_streamed_lookup_reads_whole_body(mock_api: _UseHandler) -> None:
+    """Mit ijson: erster Eintrag wird geparst, der Rest des Bodys trotzdem gelesen (Verbindung bleibt im Pool)."""
+    pytest.importorskip("ijson")
+    drained: list[bool] = []
+
+    def body() -> Iterator[bytes]:
+        yield _FIRST_ENTRY
+        yield _TAIL
+        drained.append(True)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body())
+
+    mock_api(handler)
+    info = get_color_name_from_hex("#FF0001")
+
+    assert info.display_name == "Red" and info.matched_hex == "#FF0000"
+    assert drained == [True]
+
+
+def _entry(requested: str, name: str) -> dict[str, object]:
+    """One Color.Pizza entry for an exact match of the requested hex (without '#')."""
+    return {"name": name, "hex": f"#{requested}", "requestedHex": f"#{requested}", "distance": 0.0}
+
+
+def test_batch_lookup_seeds_single_lookups(mock_api: _UseHandler) -> None:
+    """Ein Batch-Request für alle ungecachten Farben; Einzel-Lookups danach kommen ohne Request aus dem Cache."""
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        values: str = request.url.params["values"]
+        requests.append(values)
+        return httpx.Response(200, json={"colors": [_entry(value, f"Name {value}") for value in values.split(",")]})
+
+    mock_api(handler)
+    infos = get_color_names_from_hexes(["#112233", "445566", "#112233"])
+    single = get_color_name_from_hex("#445566")
+    again = get_color_names_from_hexes(["#445566", "#778899"])
+
+    assert [info.display_name for info in infos] == ["Name 112233", "Name 445566", "Name 112233"]
+    assert single.display_name == "Name 445566"
+    assert [info.display_name for info in again] == ["Name 445566", "Name 778899"]
+    assert requests == ["112233,445566", "778899"]
+
+
+def test_buffered_lookup_is_memoized(
+    buffered_api: _UseHandler,
+) -> None:
+    """Ohne ijson wird der ganze Body dekodiert; ein zweiter Lookup derselben Farbe geht nicht mehr ans Netz."""
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.params["values"])
+        return httpx.Response(200, content=_FIRST_ENTRY + _TAIL)
+
+    buffered_api(handler)
+    info = get_color_name_from_hex("#ff0001")
+    again = get_color_name_from_hex("FF0001")
+
+    assert info.display_name == "Red" and info.matched_hex == "#FF0000" and not info.exact_match
+    assert again is info
+    assert requests == ["FF0001"]
+
+
+@pytest.mark.parametrize(
+    ("response", "error"),
+    [
+        (httpx.Response(503), httpx.HTTPStatusError),
+        (httpx.Response(200, content=b"not json"), ValueError),
+        (httpx.Response(200, json=[1, 2]), RuntimeError),
+        (httpx.Response(200, json={"colors": []}), RuntimeError),
+    ],
+    ids=["http-error", "invalid-json", "top-level-array", "no-entries"],
+)
+def test_failed_lookup_is_not_memoized(
+    buffered_api: _UseHandler,
+    response: httpx.Response,
+    error: type[Exception],
+) -> None:
+    """Fehler werden nicht gecacht: der nächste Lookup fragt erneut an und bekommt den Namen."""
+    responses: list[httpx.Response] = [response, httpx.Response(200, content=_FIRST_ENTRY + _TAIL)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    buffered_api(handler)
+    with pytest.raises(error):
+        get_color_name_from_hex("#FF0001")
+    assert get_color_name_from_hex("#FF0001").display_name == "Red"
+    assert responses == []
+
+
+@pytest.mark.parametrize(
+    "hex_code",
+    ["0x1234", "+12345", " 12 34", "#12 345", "１２３４５６", "12345٠", "#GG0000", "#12345", "1234567", ""],
+)
+def test_invalid_hex_is_rejected(hex_code: str) -> None:
+    """Nur genau sechs ASCII-Hexziffern (optional mit '#') sind gültig; sonst ValueError, ohne Request."""
+    with pytest.raises(ValueError, match="Invalid hex color"):
+        get_color_name_from_hex(hex_code)
+
+
+@pytest.mark.parametrize(
+    ("hex_code", "expected"),
+    [("#abcdef", "#ABCDEF"), (" 0a0B0c ", "#0A0B0C"), ("# 123456", "#123456")],
+)
+def test_valid_hex_is_normalized(hex_code: str, expected: str) -> None:
+    """Groß-/Kleinschreibung und umgebende Leerzeichen werden normalisiert."""
+    assert color_api._normalize_hex(hex_code) == expected
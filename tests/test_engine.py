@@ -1,81 +1,135 @@
 # tests/test_engine.py
 from __future__ import annotations
-from dataclasses import replace
+import operator
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING
 
-from color_sentence import compute_color, ComputeConfig, ComputeMode, Denominator
+import pytest
 
+from color_sentence import clear_compute_cache, compute_color, compute_colors, ComputeConfig, ComputeMode, Denominator
+from color_sentence.config.gui_config import LUMA_WEIGHT_B, LUMA_WEIGHT_G, LUMA_WEIGHT_R
+from color_sentence.core import engine
+from color_sentence.core.normalization import transliterate_de
+from color_sentence.core.overrides import _compile_fused_pattern, find_override_and_weight
+from color_sentence.net.color_api import ColorNameInfo
 
-def _luminance(rgb: tuple[int, int, int]) -> float:
-    """Relative Luminanz (sRGB-gewichtet), 0..255-Skala."""
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+_CFG_FREQ_PLAIN: ComputeConfig = ComputeConfig(
+    mode=ComputeMode.FREQ,
+    punctuation_mods=False,
+    apply_length_floor=False,
+)
+_CFG_FREQ_PLAIN_EN: ComputeConfig = ComputeConfig(
+    mode=ComputeMode.FREQ,
+    punctuation_mods=False,
+    apply_length_floor=False,
+    speak_locale="en-US",
+)
+_CFG_FREQ_LETTERS: ComputeConfig = ComputeConfig(
+    mode=ComputeMode.FREQ,
+    denominator=Denominator.LETTERS,
+    punctuation_mods=False,
+    apply_length_floor=False,
+)
+_CFG_FREQ_PUNCT: ComputeConfig = ComputeConfig(
+    mode=ComputeMode.FREQ,
+    punctuation_mods=True,
+    apply_length_floor=False,
+)
+_CFG_FREQ_FLOOR: ComputeConfig = ComputeConfig(
+    mode=ComputeMode.FREQ,
+    punctuation_mods=False,
+    apply_length_floor=True,
+)
+_CFG_ANCHOR_PLAIN: ComputeConfig = ComputeConfig(
+    mode=ComputeMode.ANCHOR,
+    punctuation_mods=False,
+    apply_length_floor=False,
+)
+_CFG_ANCHOR_PUNCT: ComputeConfig = ComputeConfig(
+    mode=ComputeMode.ANCHOR,
+    punctuation_mods=True,
+    apply_length_floor=False,
+)
+_CFG_FULL_BY_MODE: tuple[ComputeConfig, ...] = tuple(
+    ComputeConfig(mode=mode, punctuation_mods=True, apply_length_floor=True)
+    for mode in (ComputeMode.FREQ, ComputeMode.ANCHOR)
+)
+
+_LONG_RG: str = "rg " * 20
+_TXT_RDASH: str = "r--"
+_BLANK_TEXTS: tuple[str, ...] = ("", "   ", "\t\n")
+
+
+def _luminance(rgb: tuple[int, int, int]) -> int:
+    """Luminanz als Ganzzahl (Rec.709-Gewichte ×256, wie in der GUI); für Vergleiche genügt die Ordnung."""
     r, g, b = rgb
-    return 0.2126 * float(r) + 0.7152 * float(g) + 0.0722 * float(b)
+    return r * LUMA_WEIGHT_R + g * LUMA_WEIGHT_G + b * LUMA_WEIGHT_B
 
 
-def test_freq_basic_blue_override_word() -> None:
-    """Satz mit 'blau' sollte Blau-Anteil dominieren (Frequenz + Override)."""
-    cfg = ComputeConfig(
-        mode=ComputeMode.FREQ,
-        punctuation_mods=False,
-        apply_length_floor=False,
-    )
-    res = compute_color("ich bin blau", cfg)
+@pytest.mark.parametrize(
+    ("text", "cfg", "dominant"),
+    [
+        ("ich bin blau", _CFG_FREQ_PLAIN, 2),  # Frequenz + Override 'blau' → Blau
+        ("aaa", _CFG_ANCHOR_PLAIN, 2),  # Anker: 'a' liegt näher bei 'b' (Index 1) → Blau
+        ("tttt", _CFG_ANCHOR_PLAIN, 0),  # Anker: 't' (Index 19) liegt näher an 'r' (17) → Rot
+    ],
+    ids=["freq-blau", "anchor-a", "anchor-t"],
+)
+def test_dominant_channel(text: str, cfg: ComputeConfig, dominant: int) -> None:
+    """Der erwartete Kanal dominiert das Ergebnis."""
+    res = compute_color(text, cfg)
     r, g, b = res.rgb
-    assert b >= r and b >= g
+    assert res.rgb[dominant] == max(r, g, b)
 
 
 def test_suffix_weight_strength() -> None:
     """'blau' (70%) sollte stärker Richtung Blau gehen als 'blaeulich' (35%)."""
-    cfg = ComputeConfig(
-        mode=ComputeMode.FREQ,
-        punctuation_mods=False,
-        apply_length_floor=False,
-    )
-    res_base = compute_color("blau", cfg)
-    res_lich = compute_color("blaeulich", cfg)
+    res_base = compute_color("blau", _CFG_FREQ_PLAIN)
+    res_lich = compute_color("blaeulich", _CFG_FREQ_PLAIN)
     # Blau-Kanal sollte bei vollem Wort höher sein
     assert res_base.rgb[2] > res_lich.rgb[2]
 
 
 def test_transliteration_umlaut() -> None:
     """'bläulich' muss wie 'blaeulich' wirken (Umlaute-Transliteration)."""
-    cfg = ComputeConfig(
-        mode=ComputeMode.FREQ,
-        punctuation_mods=False,
-        apply_length_floor=False,
-    )
-    res_umlaut = compute_color("bläulich", cfg)
-    res_ascii = compute_color("blaeulich", cfg)
+    res_umlaut = compute_color("bläulich", _CFG_FREQ_PLAIN)
+    res_ascii = compute_color("blaeulich", _CFG_FREQ_PLAIN)
     # Gleiche Tendenz und sehr ähnliche Werte
     assert res_umlaut.rgb[2] >= res_umlaut.rgb[0]  # blau dominiert
     # Differenz darf existieren (z. B. durch Längenunterschiede), aber nicht riesig
-    diff = sum(abs(a - b) for a, b in zip(res_umlaut.rgb, res_ascii.rgb))
+    r1, g1, b1 = res_umlaut.rgb
+    r2, g2, b2 = res_ascii.rgb
+    diff = abs(r1 - r2) + abs(g1 - g2) + abs(b1 - b2)
     assert diff < 40
 
 
-def test_punctuation_brightness_exclamations() -> None:
-    """'!' sollte heller/satter machen als ohne Satzzeichen."""
-    cfg = ComputeConfig(
-        mode=ComputeMode.FREQ,
-        punctuation_mods=True,
-        apply_length_floor=False,
-    )
-    res_plain = compute_color("blau", replace(cfg, punctuation_mods=False))
-    res_exc = compute_color("blau!!!", cfg)
-
-    assert _luminance(res_exc.rgb) > _luminance(res_plain.rgb)
+def test_denominator_visible_vs_letters() -> None:
+    """
+    Bei 'r--' ist die Basis für VISIBLE größer (inkl. '-'), daher ist Rot-Kanal
+    kleiner als bei LETTERS (nur 'r').
+    """
+    res_visible = compute_color(_TXT_RDASH, _CFG_FREQ_PLAIN)  # Standard-Nenner: VISIBLE
+    res_letters = compute_color(_TXT_RDASH, _CFG_FREQ_LETTERS)
+    assert res_visible.rgb[0] < res_letters.rgb[0]  # Rot kleiner bei größerem Nenner
 
 
-def test_punctuation_brightness_questions() -> None:
-    """'??' sollte abdunkeln gegenüber ohne Satzzeichen."""
-    cfg = ComputeConfig(
-        mode=ComputeMode.FREQ,
-        punctuation_mods=True,
-        apply_length_floor=False,
-    )
-    res_plain = compute_color("blau", replace(cfg, punctuation_mods=False))
-    res_q = compute_color("blau??", cfg)
+@pytest.mark.parametrize(
+    ("text", "compare"),
+    [
+        ("blau!!!", operator.gt),  # '!' macht heller/satter
+        ("blau??", operator.le),  # '??' dunkelt ab
+    ],
+)
+def test_punctuation_brightness(text: str, compare: Callable[[int, int], bool]) -> None:
+    """Satzzeichen verschieben die Helligkeit gegenüber 'blau' ohne Satzzeichen."""
+    res_plain = compute_color("blau", _CFG_FREQ_PLAIN)
+    res_punct = compute_color(text, _CFG_FREQ_PUNCT)
 
-    assert _luminance(res_q.rgb) <= _luminance(res_plain.rgb)
+    assert compare(_luminance(res_punct.rgb), _luminance(res_plain.rgb))
 
 
 def test_length_floor_short_vs_long() -> None:
@@ -83,80 +137,192 @@ def test_length_floor_short_vs_long() -> None:
     Kurzer Text 'rg' wird aufgehellt, langer Text mit gleicher r/g-Verteilung bleibt
     näher an 128/128 (ohne Floor wäre identisch).
     """
-    base_cfg = ComputeConfig(
-        mode=ComputeMode.FREQ,
-        punctuation_mods=False,
-        apply_length_floor=True,
-    )
     # gleicher Buchstabenmix, aber unterschiedlich lange Eingaben
-    res_short = compute_color("rg", base_cfg)              # sehr kurz -> hell
-    res_long = compute_color("rg " * 20, base_cfg)         # viele sichtbare Zeichen -> gedämpfter
+    res_short = compute_color("rg", _CFG_FREQ_FLOOR)              # sehr kurz -> hell
+    res_long = compute_color(_LONG_RG, _CFG_FREQ_FLOOR)           # viele sichtbare Zeichen -> gedämpfter
 
-    assert max(res_short.rgb) > max(res_long.rgb)
+    r_short, g_short, b_short = res_short.rgb
+    r_long, g_long, b_long = res_long.rgb
+    assert max(r_short, g_short, b_short) > max(r_long, g_long, b_long)
 
 
-def test_denominator_visible_vs_letters() -> None:
+def test_color_name_nonempty() -> None:
     """
-    Bei 'r--' ist die Basis für VISIBLE größer (inkl. '-'), daher ist Rot-Kanal
-    kleiner als bei LETTERS (nur 'r').
+    Namensauflösung: Unabhängig von der Web-API sollte immer ein nicht-leerer Name
+    zurückkommen (Web → Color.Pizza, sonst HSV-Heuristik).
     """
-    txt = "r--"
-    res_visible = compute_color(
-        txt,
-        ComputeConfig(
-            mode=ComputeMode.FREQ,
-            denominator=Denominator.VISIBLE,
-            punctuation_mods=False,
-            apply_length_floor=False,
-        ),
-    )
-    res_letters = compute_color(
-        txt,
-        ComputeConfig(
-            mode=ComputeMode.FREQ,
-            denominator=Denominator.LETTERS,
-            punctuation_mods=False,
-            apply_length_floor=False,
-        ),
-    )
-    assert res_visible.rgb[0] < res_letters.rgb[0]  # Rot kleiner bei größerem Nenner
+    res = compute_color("gruen", _CFG_FREQ_PLAIN)
+    assert isinstance(res.name, str) and len(res.name.strip()) > 0
 
 
-def test_anchor_mode_prefers_blue_for_a() -> None:
-    """
-    Anker-Modus: 'a' liegt näher bei 'b' (Index 1) → Blau sollte dominieren.
-    """
-    cfg = ComputeConfig(
-        mode=ComputeMode.ANCHOR,
-        punctuation_mods=False,
-        apply_length_floor=False,
-    )
-    res = compute_color("aaa", cfg)
-    r, g, b = res.rgb
-    assert b >= r and b >= g
+def test_api_failure_is_not_memoized(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fällt Color.Pizza einmal aus, gilt die HSV-Heuristik nur für diesen Aufruf; danach kommt der API-Name."""
+    calls: list[str] = []
 
+    def flaky_lookup(hex_code: str) -> ColorNameInfo:
+        calls.append(hex_code)
+        if len(calls) == 1:
+            raise RuntimeError("Color.Pizza nicht erreichbar")
+        return ColorNameInfo(
+            requested_hex=hex_code, display_name="Pizza-Rot", matched_hex=hex_code, distance=0.0, exact_match=True
+        )
 
-def test_anchor_mode_prefers_red_for_t() -> None:
-    """Anker-Modus: 't' (Index 19) liegt näher an 'r' (17) → Rot dominiert."""
-    cfg = ComputeConfig(
-        mode=ComputeMode.ANCHOR,
-        punctuation_mods=False,
-        apply_length_floor=False,
+    fake_api: ModuleType = ModuleType("color_sentence.net.color_api")
+    fake_api.get_color_name_from_hex = flaky_lookup  # type: ignore[attr-defined]
+    fake_api.get_color_names_from_hexes = (  # type: ignore[attr-defined]
+        lambda hex_codes: [flaky_lookup(code) for code in hex_codes]
     )
-    res = compute_color("tttt", cfg)
-    r, g, b = res.rgb
-    assert r >= g and r >= b
+    monkeypatch.setitem(sys.modules, "color_sentence.net.color_api", fake_api)
+    clear_compute_cache()
+    try:
+        res_down = compute_color("ich bin rot", _CFG_FREQ_PLAIN)
+        res_up = compute_color("ich bin rot", _CFG_FREQ_PLAIN)
+    finally:
+        clear_compute_cache()
 
+    assert res_down.name != "Pizza-Rot"
+    assert res_up.name == "Pizza-Rot" and res_up.rgb == res_down.rgb
+    assert len(calls) == 2
 
-def test_color_name_nonempty() -> None:
-    """
-    Namensauflösung: Unabhängig von der Web-API sollte immer ein nicht-leerer Name
-    zurückkommen (Web → Color.Pizza, sonst HSV-Heuristik).
-    """
-    cfg = ComputeConfig(
-        mode=ComputeMode.FREQ,
-        punctuation_mods=False,
-        apply_length_floor=False,
-    )
-    res = compute_color("gruen", cfg)
-    assert isinstance(res.name, str) and len(res.name.strip()) > 0
+
+def test_compute_color_memoized_per_text_and_settings() -> None:
+    """Gleicher Text + gleiche Rechen-Settings liefern das gecachte Ergebnis, auch mit anderer TTS-Config."""
+    res_first = compute_color("ich bin rot", _CFG_FREQ_PLAIN)
+    res_again = compute_color("ich bin rot", _CFG_FREQ_PLAIN_EN)
+    assert res_again is res_first
+
+    clear_compute_cache()
+    res_fresh = compute_color("ich bin rot", _CFG_FREQ_PLAIN)
+    assert res_fresh is not res_first
+    assert res_fresh == res_first
+
+
+def test_compute_colors_matches_single_calls() -> None:
+    """Batch-Berechnung liefert dieselben Ergebnisse wie Einzelaufrufe, in Eingabereihenfolge."""
+    texts = ["aaa", "tttt!", "aaa"]
+    results = compute_colors(texts, _CFG_ANCHOR_PUNCT)
+    assert results == [compute_color(txt, _CFG_ANCHOR_PUNCT) for txt in texts]
+
+
+def test_compute_colors_resolves_names_in_one_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """compute_colors fragt alle Namen mit einem Batch-Aufruf an; danach kommen die Einzel-Lookups aus dem Cache."""
+    batches: list[list[str]] = []
+    known: dict[str, ColorNameInfo] = {}
+
+    def batch_lookup(hex_codes: Sequence[str]) -> list[ColorNameInfo]:
+        batches.append(list(hex_codes))
+        for code in hex_codes:
+            known[code] = ColorNameInfo(
+                requested_hex=code, display_name=f"Pizza {code}", matched_hex=code, distance=0.0, exact_match=True
+            )
+        return [known[code] for code in hex_codes]
+
+    fake_api: ModuleType = ModuleType("color_sentence.net.color_api")
+    fake_api.get_color_name_from_hex = known.__getitem__  # type: ignore[attr-defined]
+    fake_api.get_color_names_from_hexes = batch_lookup  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "color_sentence.net.color_api", fake_api)
+    pipeline_runs: list[str] = []
+
+    def counting_transliterate(text: str) -> str:
+        pipeline_runs.append(text)
+        return transliterate_de(text)
+
+    monkeypatch.setattr(engine, "transliterate_de", counting_transliterate)
+    texts: list[str] = ["ich bin rot", "ich bin blau", "", "ich bin rot"]
+    clear_compute_cache()
+    try:
+        results = compute_colors(texts, _CFG_FREQ_PLAIN)
+        runs_first: int = len(pipeline_runs)
+        results_again = compute_colors(texts, _CFG_FREQ_PLAIN)
+    finally:
+        clear_compute_cache()
+
+    # Jeder neue Text durchläuft die Pipeline genau einmal, die Wiederholung gar nicht.
+    assert runs_first == 2 and len(pipeline_runs) == 2
+    assert results_again == results
+    assert batches[0] == [results[0].hex, results[1].hex]
+    red_name: str = f"Pizza {results[0].hex}"
+    assert [res.name for res in results] == [red_name, f"Pizza {results[1].hex}", "black", red_name]
+
+
+def test_blank_text_is_black_in_all_modes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Leerer oder nur aus Leerzeichen bestehender Text ergibt in jedem Modus Schwarz, ohne Namens-Lookup."""
+
+    def unreachable_lookup(hex_code: str) -> ColorNameInfo:
+        raise AssertionError(f"unerwarteter Color.Pizza-Lookup für {hex_code}")
+
+    fake_api: ModuleType = ModuleType("color_sentence.net.color_api")
+    fake_api.get_color_name_from_hex = unreachable_lookup  # type: ignore[attr-defined]
+    fake_api.get_color_names_from_hexes = unreachable_lookup  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "color_sentence.net.color_api", fake_api)
+    clear_compute_cache()
+    try:
+        for cfg in _CFG_FULL_BY_MODE:
+            for txt in _BLANK_TEXTS:
+                res = compute_color(txt, cfg)
+                assert res.rgb == (0, 0, 0) and res.hex == "#000000" and res.name == "black"
+            assert compute_colors(_BLANK_TEXTS, cfg) == [res] * len(_BLANK_TEXTS)
+    finally:
+        clear_compute_cache()
+
+
+@pytest.mark.parametrize(
+    ("text", "weight"),
+    [
+        ("Das ist rotſtichig", 0.50),  # 'ſ' (langes s) passt unter IGNORECASE auf 's'
+        ("rotlıch", 0.35),  # 'ı' (punktloses i) passt auf 'i'
+        ("ROTLİCH", 0.35),  # 'İ' wird kleingeschrieben zu 'i̇' (zwei Zeichen)
+    ],
+    ids=["long-s", "dotless-i", "dotted-capital-i"],
+)
+def test_case_folded_suffix_keeps_its_weight(text: str, weight: float) -> None:
+    """Suffixe, die nur per Case-Folding passen, behalten ihr Gewicht und bringen compute_color nicht zum Absturz."""
+    assert find_override_and_weight(text) == ((255, 0, 0), pytest.approx(weight))
+    res = compute_color(text, _CFG_FREQ_PLAIN)
+    assert res.rgb[0] == max(res.rgb)
+
+
+@pytest.mark.parametrize(
+    ("text", "weight"),
+    [
+        ("blau", 0.70),
+        ("blaufarben", 0.60),
+        ("blaufarbig", 0.60),
+        ("blaustichig", 0.50),
+        ("blaeulich", 0.35),
+        ("BlauSTICHIG", 0.50),
+    ],
+    ids=["base", "farben", "farbig", "stichig", "lich", "mixed-case"],
+)
+def test_override_suffix_weight(text: str, weight: float) -> None:
+    """Grundwort und jedes Suffix liefern ihr Gewicht, unabhängig von Groß-/Kleinschreibung."""
+    assert find_override_and_weight(text) == ((0, 0, 255), pytest.approx(weight))
+
+
+@pytest.mark.parametrize(
+    ("text", "rgb"),
+    [
+        ("silbern", (192, 192, 192)),
+        ("bronzen", (205, 127, 50)),
+        ("rot silbern", (224, 96, 96)),  # zwei Treffer, nicht drei
+    ],
+)
+def test_override_adjective_stem_counted_once(text: str, rgb: tuple[int, int, int]) -> None:
+    """'silbern'/'bronzen' zählen als ein Treffer, nicht zusätzlich als 'silber'/'bronze'."""
+    assert find_override_and_weight(text) == (rgb, pytest.approx(0.70))
+
+
+def test_override_averages_all_color_words() -> None:
+    """Mehrere Farbwörter: RGB und Gewicht werden über alle Treffer gemittelt."""
+    assert find_override_and_weight("rot und blaeulich") == ((128, 0, 128), pytest.approx((0.70 + 0.35) / 2))
+
+
+def test_override_without_color_word_is_none() -> None:
+    """Ohne Farbwort (auch nicht mitten im Wort) gibt es keinen Override."""
+    assert find_override_and_weight("ein Brot im Karton") is None
+
+
+def test_override_shadowed_stem_is_rejected() -> None:
+    """Ein Stamm, der mit dem Stamm einer früheren Farbe beginnt, würde nie treffen → ValueError."""
+    with pytest.raises(ValueError, match="shadowed"):
+        _compile_fused_pattern({"rot": ["rot"], "rotbraun": ["rotbraun"]}, ["lich"])
@@ -0,0 +1,13 @@
+# tests/test_normalization.py
+from __future__ import annotations
+import sys
+
+from color_sentence.core.normalization import _WHITESPACE_DELETE_TABLE, _WHITESPACE_SCAN_END, visible_len
+
+
+def test_whitespace_table_covers_every_isspace_code_point() -> None:
+    """Die Tabelle wird nur bis U+3000 gebaut; alle Code Points mit str.isspace() müssen darunter liegen."""
+    whitespace: set[int] = {code_point for code_point in range(sys.maxunicode + 1) if chr(code_point).isspace()}
+    assert max(whitespace) < _WHITESPACE_SCAN_END
+    assert set(_WHITESPACE_DELETE_TABLE) == whitespace
+    assert visible_len("".join(map(chr, sorted(whitespace))) + "a b") == 2
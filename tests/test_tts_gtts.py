@@ -0,0 +1,136 @@
+# tests/test_tts_gtts.py
+from __future__ import annotations
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from color_sentence.tts import tts_gtts
+from color_sentence.tts.tts_gtts import GttsSynthesizer, _cache_digest, _evict_wavs
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_WAV_BYTES: int = 100
+_DIGEST_HEX: str = "0" * 32
+
+
+def _wav(cache_root: Path, name: str, age_seconds: int) -> Path:
+    """Legt eine WAV-Datei fester Größe an; `age_seconds` ordnet sie in der LRU-Reihenfolge ein."""
+    path: Path = cache_root / name
+    path.write_bytes(b"\0" * _WAV_BYTES)
+    mtime: float = 1_700_000_000.0 - age_seconds
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def _cached_name(speed: str, index: int) -> str:
+    return f"{speed}_{index:032x}.wav"
+
+
+def test_evict_wavs_keeps_fresh_wav_and_fits_limit(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Die ältesten WAVs fallen weg, bis das Limit passt; die gerade geschriebene bleibt, auch wenn sie alt ist."""
+    monkeypatch.setattr(tts_gtts, "WAV_CACHE_MAX_BYTES", 3 * _WAV_BYTES)
+    keep: Path = _wav(tmp_path, _cached_name("fast", 0), age_seconds=50)  # ältester Zeitstempel
+    older: Path = _wav(tmp_path, _cached_name("slow", 1), age_seconds=40)
+    old: Path = _wav(tmp_path, _cached_name("fast", 2), age_seconds=30)
+    recent: Path = _wav(tmp_path, _cached_name("fast", 3), age_seconds=20)
+    newest: Path = _wav(tmp_path, _cached_name("slow", 4), age_seconds=10)
+
+    _evict_wavs(tmp_path, keep)
+
+    remaining: list[Path] = sorted(tmp_path.iterdir())
+    assert remaining == sorted([keep, recent, newest])
+    assert not older.exists() and not old.exists()
+    assert sum(path.stat().st_size for path in remaining) <= tts_gtts.WAV_CACHE_MAX_BYTES
+
+
+def test_evict_wavs_only_touches_cache_wavs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Nur Dateien nach dem Muster des WAV-Caches werden gelöscht, selbst wenn das Limit überschritten bleibt."""
+    monkeypatch.setattr(tts_gtts, "WAV_CACHE_MAX_BYTES", 0)
+    foreign_names: list[str] = [
+        "user_notes.wav",
+        f"fast_{_DIGEST_HEX}.mp3",
+        "gtts_1_2_3.wav",
+        f"fast_{_DIGEST_HEX}0.wav",
+        f"FAST_{_DIGEST_HEX}.wav",
+        f"medium_{_DIGEST_HEX}.wav",
+    ]
+    foreign: list[Path] = [_wav(tmp_path, name, age_seconds=100) for name in foreign_names]
+    cached: Path = _wav(tmp_path, _cached_name("fast", 1), age_seconds=50)
+    keep: Path = _wav(tmp_path, _cached_name("slow", 2), age_seconds=10)
+
+    _evict_wavs(tmp_path, keep)
+
+    assert all(path.exists() for path in foreign)
+    assert not cached.exists()
+    assert keep.exists()
+
+
+def test_cache_filename_is_stable_and_distinct(tmp_path: Path) -> None:
+    """Gleiche Eingaben ergeben denselben Dateinamen; anderer Text, Sprache oder slow-Flag einen anderen."""
+    fast = GttsSynthesizer(language="de", slow=False, cache_dir=tmp_path)
+    slow = GttsSynthesizer(language="de", slow=True, cache_dir=tmp_path)
+    english = GttsSynthesizer(language="en", slow=False, cache_dir=tmp_path)
+
+    name: Path = fast._cached_mp3_for_text("Das ist Rot.")
+    assert name == GttsSynthesizer(language="de", slow=False, cache_dir=tmp_path)._cached_mp3_for_text("Das ist Rot.")
+    assert name.parent == tmp_path.absolute()
+
+    others: list[Path] = [
+        fast._cached_mp3_for_text("Das ist Blau."),
+        slow._cached_mp3_for_text("Das ist Rot."),
+        english._cached_mp3_for_text("Das ist Rot."),
+    ]
+    assert name not in others and len(set(others)) == len(others)
+
+
+def test_cache_digest_does_not_depend_on_memo() -> None:
+    """Der memoisierte Digest ist derselbe wie ein frisch berechneter (128 Bit, 32 Hex-Zeichen)."""
+    digest: str = _cache_digest("de", False, "Das ist Rot.")
+    _cache_digest.cache_clear()
+    assert _cache_digest("de", False, "Das ist Rot.") == digest
+    assert len(digest) == 32 and int(digest, 16) >= 0
+    assert _cache_digest("de", True, "Das ist Rot.") != digest
+
+
+class _FailingGtts:
+    """Schreibt eine halbe Datei und scheitert dann wie gTTS bei einer unbekannten Sprache."""
+
+    def __init__(self, text: str, lang: str, slow: bool) -> None:
+        self.text: str = text
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as handle:
+            handle.write(b"ID3")
+        raise ValueError("Language not supported")
+
+
+class _WritingGtts(_FailingGtts):
+    def save(self, path: str) -> None:
+        with open(path, "wb") as handle:
+            handle.write(self.text.encode("utf-8"))
+
+
+def test_synthesis_failure_leaves_no_temp_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Auch ein Fehler außerhalb von gTTSError/OSError räumt die Temp-Datei im Cache-Ordner weg."""
+    monkeypatch.setattr(tts_gtts, "gTTS", _FailingGtts)
+    synth = GttsSynthesizer(language="xx", cache_dir=tmp_path)
+    target: Path = synth._cached_mp3_for_text("Das ist Rot.")
+
+    with pytest.raises(ValueError, match="Language not supported"):
+        synth._synthesize_to(target, "Das ist Rot.")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_synthesis_success_leaves_only_target(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Nach erfolgreicher Synthese liegt nur die Zieldatei im Cache-Ordner."""
+    monkeypatch.setattr(tts_gtts, "gTTS", _WritingGtts)
+    synth = GttsSynthesizer(language="de", cache_dir=tmp_path)
+    target: Path = synth._cached_mp3_for_text("Das ist Rot.")
+
+    synth._synthesize_to(target, "Das ist Rot.")
+
+    assert list(tmp_path.iterdir()) == [target]
+    assert target.read_bytes() == b"Das ist Rot."
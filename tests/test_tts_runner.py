@@ -0,0 +1,176 @@
+# tests/test_tts_runner.py
+from __future__ import annotations
+import threading
+import time
+from pathlib import Path
+from threading import Event, Semaphore
+
+from color_sentence.config.types import IPrefetchTTS
+from color_sentence.tts.tts_runner import TtsRunner
+
+_TIMEOUT: float = 2.0
+# Deutlich unter dem Join-Timeout von shutdown() (0.5 s).
+_PROMPT_SHUTDOWN: float = 0.3
+
+
+class _SpeakBackend:
+    """Einfaches ITTS: merkt sich gesprochene Sätze; warmup blockiert bis `ready` gesetzt ist."""
+
+    def __init__(self) -> None:
+        self.ready: Event = Event()
+        self.ready.set()
+        self.spoken: list[str] = []
+        self.speak_count: Semaphore = Semaphore(0)
+
+    def warmup(self) -> None:
+        self.ready.wait(_TIMEOUT)
+
+    def speak(self, text: str) -> None:
+        self.spoken.append(text)
+        self.speak_count.release()
+
+
+class _PrefetchBackend(_SpeakBackend):
+    """IPrefetchTTS: Synthese und Wiedergabe getrennt, Ereignisse werden protokolliert."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.log: list[str] = []
+        self.synth_started: dict[str, Event] = {}
+        self.synth_gate: Event = Event()
+        self.synth_gate.set()
+        self.ahead_seen_while_playing: dict[str, list[str]] = {}
+        self.expect_ahead: dict[str, str] = {}
+        self.play_started: dict[str, Event] = {}
+        self.synth_on_daemon: list[bool] = []
+
+    def synthesize(self, text: str) -> Path:
+        self.log.append(f"synth:{text}")
+        self.synth_on_daemon.append(threading.current_thread().daemon)
+        self.synth_started.setdefault(text, Event()).set()
+        self.synth_gate.wait(_TIMEOUT)
+        if text == "kaputt":
+            raise RuntimeError("Synthese fehlgeschlagen")
+        return Path(f"{text}.mp3")
+
+    def play(self, audio_path: Path) -> None:
+        text: str = audio_path.stem
+        self.play_started.setdefault(text, Event()).set()
+        # Die Vorab-Synthese läuft parallel an; auf ihren Start warten, bevor protokolliert wird.
+        if text in self.expect_ahead:
+            self.synth_started.setdefault(self.expect_ahead[text], Event()).wait(_TIMEOUT)
+        self.ahead_seen_while_playing[text] = [entry for entry in self.log if entry.startswith("synth:")]
+        self.log.append(f"play:{text}")
+        self.speak(text)
+
+
+def _enqueue_before_start(runner: TtsRunner, backend: _SpeakBackend, texts: list[str]) -> None:
+    """Sätze einreihen, während der Worker noch in warmup() hängt, dann loslassen."""
+    backend.ready.clear()
+    for text in texts:
+        runner.enqueue(text)
+    backend.ready.set()
+
+
+def _await_spoken(backend: _SpeakBackend, count: int) -> None:
+    for _ in range(count):
+        assert backend.speak_count.acquire(timeout=_TIMEOUT)
+
+
+def test_prefetch_synthesizes_one_ahead_in_order() -> None:
+    """Der nächste Satz wird während der Wiedergabe synthetisiert, nicht mehr; Wiedergabe in Reihenfolge."""
+    backend = _PrefetchBackend()
+    backend.expect_ahead["a"] = "b"
+    runner = TtsRunner(backend)
+    _enqueue_before_start(runner, backend, ["a", "b", "c"])
+    _await_spoken(backend, 3)
+    runner.shutdown()
+
+    assert isinstance(backend, IPrefetchTTS)
+    assert backend.spoken == ["a", "b", "c"]
+    assert backend.ahead_seen_while_playing["a"] == ["synth:a", "synth:b"]
+    assert backend.log.index("synth:c") > backend.log.index("play:a")
+
+
+def test_prefetch_covers_items_queued_during_playback() -> None:
+    """Ein erst während der Wiedergabe eingereihter Satz wird noch während dieser Wiedergabe synthetisiert."""
+    backend = _PrefetchBackend()
+    backend.expect_ahead["a"] = "b"
+    runner = TtsRunner(backend)
+    backend.play_started.setdefault("a", Event())
+    runner.enqueue("a")
+    assert backend.play_started["a"].wait(_TIMEOUT)
+    runner.enqueue("b")
+    _await_spoken(backend, 2)
+    runner.shutdown()
+
+    assert backend.spoken == ["a", "b"]
+    assert backend.ahead_seen_while_playing["a"] == ["synth:a", "synth:b"]
+    # Daemon-Threads: eine laufende Synthese hält das Programmende nicht auf.
+    assert backend.synth_on_daemon == [True, True]
+
+
+def test_prefetch_synthesis_error_skips_only_that_item() -> None:
+    """Ein RuntimeError aus synthesize() überspringt nur diesen Satz."""
+    backend = _PrefetchBackend()
+    runner = TtsRunner(backend)
+    _enqueue_before_start(runner, backend, ["a", "kaputt", "c"])
+    _await_spoken(backend, 2)
+    runner.shutdown()
+
+    assert backend.spoken == ["a", "c"]
+
+
+def test_plain_backend_uses_speak() -> None:
+    """Ein Backend ohne synthesize/play wird direkt über speak() bedient."""
+    backend = _SpeakBackend()
+    runner = TtsRunner(backend)
+    _enqueue_before_start(runner, backend, ["a", "b"])
+    _await_spoken(backend, 2)
+    runner.shutdown()
+
+    assert not isinstance(backend, IPrefetchTTS)
+    assert backend.spoken == ["a", "b"]
+
+
+def test_shutdown_is_prompt_during_synthesis() -> None:
+    """shutdown() wartet nicht auf eine laufende Synthese."""
+    backend = _PrefetchBackend()
+    backend.synth_gate.clear()
+    runner = TtsRunner(backend)
+    runner.enqueue("a")
+    assert backend.synth_started.setdefault("a", Event()).wait(_TIMEOUT)
+    worker = runner._thread
+    assert worker is not None
+
+    started: float = time.perf_counter()
+    runner.shutdown()
+    elapsed: float = time.perf_counter() - started
+    backend.synth_gate.set()
+
+    assert elapsed < _PROMPT_SHUTDOWN
+    assert not worker.is_alive()
+    assert backend.spoken == []
+
+
+def test_full_queue_drops_oldest() -> None:
+    """Ist die Warteschlange voll, fällt der älteste Satz heraus."""
+    backend = _SpeakBackend()
+    runner = TtsRunner(backend, max_queue=2)
+    _enqueue_before_start(runner, backend, ["a", "b", "c"])
+    _await_spoken(backend, 2)
+    runner.shutdown()
+
+    assert backend.spoken == ["b", "c"]
+
+
+def test_enqueue_while_idle_is_always_spoken() -> None:
+    """Wiederholt in den leerlaufenden Worker eingereiht: kein Weckruf geht verloren."""
+    backend = _SpeakBackend()
+    runner = TtsRunner(backend)
+    for index in range(200):
+        runner.enqueue(str(index))
+        _await_spoken(backend, 1)
+    runner.shutdown()
+
+    assert backend.spoken == [str(index) for index in range(200)]